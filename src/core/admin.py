@@ -112,6 +112,7 @@ class WorkerTaskAttemptAdmin(admin.ModelAdmin):
         "available_at",
         "created_at",
     )
+    list_select_related = ("task",)
     list_filter = ("status", "will_retry")
     search_fields = ("task__id", "error_code", "error_message")
     ordering = ("-created_at",)
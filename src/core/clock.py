@@ -0,0 +1,30 @@
+"""Единое «сейчас» для одной единицы работы (запроса или фоновой задачи)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+from django.utils import timezone
+
+_CAPTURED_NOW: ContextVar[datetime | None] = ContextVar("captured_now", default=None)
+
+
+def now() -> datetime:
+    """Возвращает зафиксированное время текущей единицы работы или `timezone.now()`."""
+
+    return _CAPTURED_NOW.get() or timezone.now()
+
+
+@contextmanager
+def captured_now(value: datetime | None = None) -> Iterator[datetime]:
+    """Фиксирует время на время блока, чтобы все отметки внутри совпадали."""
+
+    captured = value or timezone.now()
+    token = _CAPTURED_NOW.set(captured)
+    try:
+        yield captured
+    finally:
+        _CAPTURED_NOW.reset(token)
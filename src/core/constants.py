@@ -4,6 +4,7 @@ from __future__ import annotations
 
 DEFAULT_COLLECT_LIMIT = 100
 REWRITE_MAX_ATTEMPTS = 3
+REWRITE_BATCH_CONCURRENCY = 4
 OPENAI_DEFAULT_TEMPERATURE = 0.2
 OPENAI_RESPONSE_FORMAT = {"type": "json_object"}
 
@@ -0,0 +1,34 @@
+"""Быстрая (де)сериализация JSON для запросов к внешним API.
+
+Использует orjson, если он установлен, иначе — стандартный `json`.
+`dumps` всегда возвращает UTF-8 байты, `loads` принимает байты напрямую.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - optional dependency guard
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(value: Any) -> bytes:
+    """Сериализует значение в UTF-8 байты."""
+
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Разбирает JSON из байтов или строки.
+
+    Ошибки разбора — подкласс `json.JSONDecodeError` при любом бэкенде.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import atexit
 import time
 from collections.abc import Sequence
 
 from django.core.management.base import BaseCommand, CommandError
 
 from core.services.worker import make_runner
+from projects.workers import close_telethon_pool
 
 
 class Command(BaseCommand):
@@ -70,6 +72,7 @@ class Command(BaseCommand):
             worker_prefix=worker_prefix,
         )
 
+        atexit.register(close_telethon_pool)
         if run_once:
             processed = sum(runner.run_once() for runner in runners)
             self.stdout.write(self.style.SUCCESS(f"Processed {processed} tasks"))
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import atexit
+
 from django.core.management.base import BaseCommand, CommandError
 from django.utils.module_loading import import_string
 
 from core.services.worker import make_runner
+from projects.workers import close_telethon_pool
 
 
 class Command(BaseCommand):
@@ -70,6 +73,7 @@ class Command(BaseCommand):
         except LookupError as exc:
             raise CommandError(str(exc)) from exc
 
+        atexit.register(close_telethon_pool)
         if run_once:
             processed = runner.run_once()
             self.stdout.write(self.style.SUCCESS(f"Processed {processed} tasks"))
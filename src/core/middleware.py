@@ -6,11 +6,16 @@ from collections.abc import Callable
 
 from django.http import HttpRequest, HttpResponse
 
+from core.clock import captured_now
 from core.logging import event_logger, generate_correlation_id, logging_context
 
 
 class RequestContextMiddleware:
-    """Добавляет correlation_id и user_id в контекст логирования каждого запроса."""
+    """Добавляет correlation_id и user_id в контекст логирования каждого запроса.
+
+    Заодно фиксирует время запроса (`core.clock.now`), чтобы отметки статусов
+    внутри одного запроса совпадали.
+    """
 
     header_name = "HTTP_X_CORRELATION_ID"
 
@@ -26,7 +31,10 @@ class RequestContextMiddleware:
         if user is not None and getattr(user, "is_authenticated", False):
             user_id = user.pk
 
-        with logging_context(correlation_id=correlation_id, user_id=user_id):
+        with (
+            logging_context(correlation_id=correlation_id, user_id=user_id),
+            captured_now(),
+        ):
             try:
                 response = self.get_response(request)
             except Exception as exc:  # pragma: no cover - защитное логирование
@@ -6,6 +6,7 @@ from .worker import (  # noqa: F401
     WorkerRunner,
     enqueue_task,
     get_handler,
+    get_worker_loop,
     make_runner,
     make_worker_id,
     register_handler,
@@ -17,6 +18,7 @@ __all__ = [
     "WorkerRunner",
     "enqueue_task",
     "get_handler",
+    "get_worker_loop",
     "make_runner",
     "make_worker_id",
     "register_handler",
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import socket
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime
@@ -11,6 +13,7 @@ from typing import Any, Protocol
 
 from django.utils import timezone
 
+from core.clock import captured_now
 from core.logging import (
     current_correlation_id,
     event_logger,
@@ -142,7 +145,8 @@ class WorkerRunner:
             story_id=story_id,
         ):
             try:
-                result = self.handler(task)
+                with captured_now(start):
+                    result = self.handler(task)
             except TaskExecutionError as exc:
                 self._handle_task_error(task, exc)
             except Exception as exc:  # pragma: no cover - defensive logging
@@ -312,6 +316,23 @@ def enqueue_task(
     return task
 
 
+_loop_state = threading.local()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Возвращает долгоживущий event loop текущего потока воркера.
+
+    Обработчики используют его вместо ``asyncio.run``, чтобы не создавать
+    и не закрывать новый цикл на каждую задачу.
+    """
+
+    loop = getattr(_loop_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _loop_state.loop = loop
+    return loop
+
+
 def make_worker_id(queue: str) -> str:
     """Генерирует (относительно) детерминированный ID воркера, используя имя хоста и PID."""
 
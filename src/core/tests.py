@@ -3,21 +3,29 @@
 from __future__ import annotations
 
 import io
+import json
 import re
 from datetime import timedelta
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.management import call_command
-from django.test import RequestFactory, TestCase, override_settings
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
+from core import clock, json_fast
 from core.constants import REWRITE_MAX_ATTEMPTS
 from core.logging import event_logger, logging_context
 from core.middleware import RequestContextMiddleware
 from core.models import WorkerTask
-from core.services.worker import TaskExecutionError, WorkerRunner, enqueue_task
+from core.services.worker import (
+    TaskExecutionError,
+    WorkerRunner,
+    enqueue_task,
+    get_worker_loop,
+)
 from projects.models import Post, Project, Source
 
 User = get_user_model()
@@ -140,6 +148,13 @@ class WorkerQueueTests(TestCase):
         self.assertEqual(task.status, WorkerTask.Status.QUEUED)
         self.assertEqual(task.locked_by, "")
 
+    def test_worker_loop_reused_between_calls(self) -> None:
+        """Проверяет, что event loop воркера создаётся один раз на поток."""
+        loop = get_worker_loop()
+        self.assertIs(get_worker_loop(), loop)
+        loop.close()
+        self.assertIsNot(get_worker_loop(), loop)
+
 
 class FeedViewTests(TestCase):
     """Тесты для представлений ленты."""
@@ -210,6 +225,22 @@ class StructuredLoggingTests(TestCase):
         self.assertEqual(payload["story_id"], 5)
 
 
+class JsonFastTests(SimpleTestCase):
+    """Тесты для быстрой сериализации JSON."""
+
+    def test_round_trip_through_bytes(self) -> None:
+        """Проверяет, что dumps возвращает байты, а loads их принимает."""
+        payload = {"text": "Привет", "items": [1, 2]}
+        encoded = json_fast.dumps(payload)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json_fast.loads(encoded), payload)
+
+    def test_decode_error_is_stdlib_compatible(self) -> None:
+        """Проверяет, что ошибка разбора ловится как json.JSONDecodeError."""
+        with self.assertRaises(json.JSONDecodeError):
+            json_fast.loads(b"{broken")
+
+
 class RequestContextMiddlewareTests(TestCase):
     """Тесты для middleware контекста запроса."""
 
@@ -222,6 +253,18 @@ class RequestContextMiddlewareTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["X-Correlation-ID"], "abc123")
 
+    def test_captures_single_now_per_request(self) -> None:
+        """Проверяет, что внутри запроса `clock.now()` возвращает одно и то же время."""
+        seen = []
+
+        def view(request):
+            seen.extend([clock.now(), clock.now()])
+            return HttpResponse("ok")
+
+        RequestContextMiddleware(view)(self.factory.get("/"))
+
+        self.assertEqual(seen[0], seen[1])
+
     def test_logs_unhandled_exception(self) -> None:
         """Проверяет, что необработанные исключения логируются."""
         def raising_view(request):
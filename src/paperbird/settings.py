@@ -221,6 +221,8 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "").strip()
 OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "30"))
+# Срок жизни кэша ответов рерайта в секундах; 0 — кэш выключен.
+REWRITE_CACHE_TTL = int(os.getenv("REWRITE_CACHE_TTL", "0"))
 OPENAI_IMAGE_TIMEOUT = float(os.getenv("OPENAI_IMAGE_TIMEOUT", "60"))
 OPENAI_IMAGE_URL = os.getenv(
     "OPENAI_IMAGE_URL",
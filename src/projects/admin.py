@@ -10,6 +10,7 @@ class ProjectAdmin(admin.ModelAdmin):
     """Настройки админ-панели для проектов."""
 
     list_display = ("name", "owner", "is_active", "created_at")
+    list_select_related = ("owner",)
     list_filter = ("is_active", "created_at")
     search_fields = ("name", "owner__username", "owner__email")
     readonly_fields = ("created_at", "updated_at")
@@ -29,6 +30,7 @@ class SourceAdmin(admin.ModelAdmin):
         "is_active",
         "last_synced_at",
     )
+    list_select_related = ("project", "web_preset")
     list_filter = ("is_active", "project", "type")
     search_fields = ("title", "username", "telegram_id", "web_preset__name")
     readonly_fields = (
@@ -55,6 +57,7 @@ class PostAdmin(admin.ModelAdmin):
         "collected_at",
         "has_media",
     )
+    list_select_related = ("project", "source")
     list_filter = ("status", "project", "source", "has_media", "origin_type")
     search_fields = ("telegram_id", "message", "source_url", "canonical_url")
     readonly_fields = ("collected_at", "updated_at", "text_hash", "media_hash", "content_hash")
@@ -66,6 +69,7 @@ class SourceSyncLogAdmin(admin.ModelAdmin):
     """Настройки админ-панели для логов синхронизации."""
 
     list_display = ("source", "status", "fetched_messages", "skipped_messages", "started_at")
+    list_select_related = ("source",)
     list_filter = ("status", "source__project")
     search_fields = ("source__title", "source__username")
     readonly_fields = ("started_at", "finished_at")
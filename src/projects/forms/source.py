@@ -143,7 +143,10 @@ class SourceBaseForm(forms.ModelForm):
         self.fields["web_retry_max_delay"].widget.attrs["class"] += " source-web-field"
 
         # Initial values and querysets
-        self.fields["web_preset"].queryset = WebPreset.objects.order_by("name", "version")
+        # Для выпадающего списка конфигурация пресета не нужна — это самый тяжёлый столбец.
+        self.fields["web_preset"].queryset = WebPreset.objects.only(
+            "id", "name", "version", "title"
+        ).order_by("name", "version")
         if not self.initial.get("retention_days"):
             self.fields["retention_days"].initial = project.retention_days
         if not self.initial.get("web_retry_max_attempts"):
@@ -0,0 +1,40 @@
+"""Периодически ставит в очередь запуски сборщиков для проектов."""
+
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from projects.services.collector_scheduler import schedule_due_collectors
+
+
+class Command(BaseCommand):
+    help = "Планирует запуски Telegram- и веб-сборщиков, у которых истёк интервал."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--every",
+            type=int,
+            default=0,
+            help="Повторять проверку каждые N секунд (0 — выполнить один раз и выйти)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=None,
+            help="Опциональное ограничение на количество проверок (полезно для тестов)",
+        )
+
+    def handle(self, *args, **options):
+        every = max(options.get("every") or 0, 0)
+        iterations_limit = options.get("iterations")
+
+        loop = 0
+        while True:
+            loop += 1
+            scheduled = schedule_due_collectors()
+            self.stdout.write(f"Запланировано задач сборщиков: {scheduled}")
+            if not every or (iterations_limit and loop >= iterations_limit):
+                break
+            time.sleep(every)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import hashlib
 from collections.abc import Iterable
-from datetime import timedelta
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
@@ -812,8 +812,10 @@ class SourceSyncLog(models.Model):
         error: str | None = None,
         fetched: int = 0,
         skipped: int = 0,
+        *,
+        at: datetime | None = None,
     ) -> None:
-        self.finished_at = timezone.now()
+        self.finished_at = at or timezone.now()
         self.status = status
         self.error_message = error or ""
         self.fetched_messages = fetched
@@ -11,23 +11,37 @@ from core.services.worker import enqueue_task
 from projects.models import Project, Source, WebPreset
 
 
-def ensure_collector_tasks(project: Project, *, delay: int = 0) -> None:
-    """Ensures project-level collector tasks are scheduled for active sources."""
+def ensure_collector_tasks(
+    project: Project,
+    *,
+    delay: int = 0,
+    due_only: bool = False,
+    now=None,
+) -> int:
+    """Ensures project-level collector tasks are scheduled for active sources.
+
+    With ``due_only`` a queue is skipped while it already has a task for the project
+    created within the collector interval, which is what the periodic tick relies on.
+    Returns the number of enqueued tasks.
+    """
 
     if not project.collector_enabled:
-        return
+        return 0
 
-    now = timezone.now()
+    now = now or timezone.now()
+    scheduled = 0
 
-    def _has_pending(queue: str) -> bool:
-        return WorkerTask.objects.filter(
-            queue=queue,
-            payload__project_id=project.pk,
-            status__in=[WorkerTask.Status.QUEUED, WorkerTask.Status.RUNNING],
-        ).exists()
+    def _has_pending(queue: str, interval: int) -> bool:
+        tasks = WorkerTask.objects.filter(queue=queue, payload__project_id=project.pk)
+        pending = tasks.filter(status__in=[WorkerTask.Status.QUEUED, WorkerTask.Status.RUNNING])
+        if due_only:
+            recent = tasks.filter(created_at__gt=now - timedelta(seconds=interval))
+            return pending.exists() or recent.exists()
+        return pending.exists()
 
     def _schedule(queue: str, interval: int) -> None:
-        if _has_pending(queue):
+        nonlocal scheduled
+        if _has_pending(queue, interval):
             return
         scheduled_for = now + timedelta(seconds=max(delay, 0))
         enqueue_task(
@@ -38,6 +52,7 @@ def ensure_collector_tasks(project: Project, *, delay: int = 0) -> None:
             },
             scheduled_for=scheduled_for,
         )
+        scheduled += 1
 
     has_telegram_sources = project.sources.filter(
         is_active=True,
@@ -59,6 +74,19 @@ def ensure_collector_tasks(project: Project, *, delay: int = 0) -> None:
             WorkerTask.Queue.COLLECTOR_WEB,
             max(project.collector_web_interval, 60),
         )
+    return scheduled
+
+
+def schedule_due_collectors(*, now=None) -> int:
+    """Periodic tick: enqueues collector runs for projects whose interval has elapsed."""
+
+    now = now or timezone.now()
+    projects = Project.objects.filter(is_active=True, collector_enabled=True).select_related(
+        "owner"
+    )
+    return sum(
+        ensure_collector_tasks(project, due_only=True, now=now) for project in projects
+    )
 
 
-__all__ = ["ensure_collector_tasks"]
+__all__ = ["ensure_collector_tasks", "schedule_due_collectors"]
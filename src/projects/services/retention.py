@@ -46,7 +46,7 @@ def schedule_retention_cleanup(
     if project is not None:
         projects = [project]
     else:
-        projects = list(Project.objects.filter(is_active=True))
+        projects = list(Project.objects.filter(is_active=True).only("id"))
 
     tasks: list[WorkerTask] = []
     for item in projects:
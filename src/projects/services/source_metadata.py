@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from core.models import WorkerTask
 from core.services.worker import enqueue_task
-from projects.models import Source
+from projects.models import Project, Source
 
 
 def enqueue_source_refresh(source: Source, *, scheduled_for=None) -> WorkerTask:
@@ -20,4 +20,14 @@ def enqueue_source_refresh(source: Source, *, scheduled_for=None) -> WorkerTask:
     )
 
 
-__all__ = ["enqueue_source_refresh"]
+def enqueue_project_sources_refresh(project: Project, *, scheduled_for=None) -> WorkerTask:
+    """Планирует одну задачу, обновляющую метаданные всех Telegram-источников проекта."""
+
+    return enqueue_task(
+        WorkerTask.Queue.SOURCE,
+        payload={"project_id": project.pk},
+        scheduled_for=scheduled_for,
+    )
+
+
+__all__ = ["enqueue_project_sources_refresh", "enqueue_source_refresh"]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
@@ -64,3 +66,84 @@ class TelethonClientFactory:
             raise TelethonCredentialsMissingError(str(exc)) from exc
         finally:
             await client.disconnect()
+
+
+class TelethonClientPool:
+    """Держит подключённые Telethon клиенты между задачами воркера.
+
+    Клиенты привязаны к event loop, в котором подключались, поэтому пул
+    рассчитан на долгоживущий цикл воркера (см. ``get_worker_loop``).
+    """
+
+    def __init__(self, max_size: int = 8) -> None:
+        self.max_size = max_size
+        self._clients: OrderedDict[tuple, TelegramClient] = OrderedDict()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @staticmethod
+    def _key(user: User) -> tuple:
+        return (user.pk, user.telethon_api_id, user.telethon_api_hash, user.telethon_session)
+
+    def _bind_loop(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop or self._lock is None:
+            if self._clients:
+                # Клиенты другого цикла нельзя ни использовать, ни корректно отключить здесь.
+                raise RuntimeError(
+                    "Пул Telethon клиентов уже привязан к другому event loop; "
+                    "закройте его через close() в исходном цикле"
+                )
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def acquire(self, factory: TelethonClientFactory) -> TelegramClient:
+        """Возвращает подключённый клиент пользователя, создавая его при необходимости."""
+
+        key = self._key(factory.user)
+        async with self._bind_loop():
+            client = self._clients.get(key)
+            if client is not None and client.is_connected():
+                self._clients.move_to_end(key)
+                return client
+            self._clients.pop(key, None)
+            client = factory.build()
+            try:
+                await client.connect()
+                if not await client.is_user_authorized():
+                    raise TelethonCredentialsMissingError(
+                        "Сессия Telethon недействительна или требует входа"
+                    )
+            except RPCError as exc:  # pragma: no cover - требует реального API
+                await client.disconnect()
+                raise TelethonCredentialsMissingError(str(exc)) from exc
+            except BaseException:
+                await client.disconnect()
+                raise
+            self._clients[key] = client
+            while len(self._clients) > self.max_size:
+                _, stale = self._clients.popitem(last=False)
+                await stale.disconnect()
+            return client
+
+    async def discard(self, user: User) -> None:
+        """Отключает и убирает из пула клиент пользователя (например, после ошибки)."""
+
+        client = self._clients.pop(self._key(user), None)
+        if client is not None:
+            await client.disconnect()
+
+    async def close(self) -> None:
+        """Отключает все клиенты пула."""
+
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.disconnect()
+
+
+telethon_pool = TelethonClientPool()
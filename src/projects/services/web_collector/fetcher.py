@@ -22,10 +22,40 @@ class FetchResult:
 
 
 class HttpFetcher:
-    """HTTP client with simple domain-based rate limiting."""
+    """HTTP client with simple domain-based rate limiting.
+
+    Keeps one pooled ``httpx.Client`` so list and article pages of a source reuse
+    keep-alive connections instead of opening a new TCP/TLS session per request.
+    """
+
+    max_connections = 32
+    max_keepalive_connections = 8
 
     def __init__(self) -> None:
         self._last_request_at: dict[str, float] = {}
+        self._client: httpx.Client | None = None
+
+    def __enter__(self) -> HttpFetcher:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+            )
+        return self._client
 
     def fetch(self, url: str, fetch_config: dict[str, Any]) -> FetchResult:
         if httpx is None:  # pragma: no cover - defensive
@@ -39,12 +69,7 @@ class HttpFetcher:
         if rate_limit_rps > 0:
             self._respect_rate_limit(url, rate_limit_rps)
         try:
-            response = httpx.get(
-                url,
-                headers=headers,
-                timeout=timeout,
-                follow_redirects=True,
-            )
+            response = self._get_client().get(url, headers=headers, timeout=timeout)
         except httpx.HTTPError as exc:
             raise RuntimeError(f"HTTP error for {url}: {exc}") from exc
         if response.status_code >= 400:
@@ -11,6 +11,7 @@ from django.utils import timezone
 from core.models import WorkerTask
 from projects.models import Post, Project, Source
 from projects.services.collector import PostCollector, _normalize_raw
+from projects.services.collector_scheduler import schedule_due_collectors
 from projects.workers import collect_project_posts_task
 
 from . import User
@@ -194,7 +195,7 @@ class CollectProjectPostsTaskTests(TestCase):
         )
 
     @patch("projects.workers.collect_for_user", new_callable=AsyncMock)
-    def test_task_collects_and_requeues(self, mock_collect) -> None:
+    def test_task_collects_without_requeue(self, mock_collect) -> None:
         task = WorkerTask.objects.create(
             queue=WorkerTask.Queue.COLLECTOR,
             payload={"project_id": self.project.id, "interval": 45},
@@ -205,7 +206,7 @@ class CollectProjectPostsTaskTests(TestCase):
         self.assertEqual(result["status"], "ok")
         self.project.refresh_from_db()
         self.assertIsNotNone(self.project.collector_last_run)
-        self.assertTrue(
+        self.assertFalse(
             WorkerTask.objects.filter(
                 queue=WorkerTask.Queue.COLLECTOR,
                 payload__project_id=self.project.id,
@@ -225,3 +226,42 @@ class CollectProjectPostsTaskTests(TestCase):
         result = collect_project_posts_task(task)
         self.assertEqual(result["status"], "skipped")
         self.assertEqual(result["reason"], "disabled")
+
+
+class ScheduleDueCollectorsTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user("ticker", password="secret")
+        self.user.telethon_api_id = 1
+        self.user.telethon_api_hash = "hash"
+        self.user.telethon_session = "session"
+        self.user.save(update_fields=["telethon_api_id", "telethon_api_hash", "telethon_session"])
+        self.project = Project.objects.create(
+            owner=self.user,
+            name="Tick",
+            collector_enabled=True,
+            collector_telegram_interval=60,
+        )
+        Source.objects.create(project=self.project, telegram_id=1, username="tick")
+
+    def _collector_tasks(self):
+        return WorkerTask.objects.filter(
+            queue=WorkerTask.Queue.COLLECTOR,
+            payload__project_id=self.project.id,
+        )
+
+    def test_enqueues_once_per_interval(self) -> None:
+        self.assertEqual(schedule_due_collectors(), 1)
+        WorkerTask.objects.filter(queue=WorkerTask.Queue.COLLECTOR).update(
+            status=WorkerTask.Status.SUCCEEDED
+        )
+        self.assertEqual(schedule_due_collectors(), 0)
+        self.assertEqual(self._collector_tasks().count(), 1)
+
+        later = timezone.now() + timedelta(seconds=61)
+        self.assertEqual(schedule_due_collectors(now=later), 1)
+        self.assertEqual(self._collector_tasks().count(), 2)
+
+    def test_skips_disabled_projects(self) -> None:
+        Project.objects.filter(pk=self.project.pk).update(collector_enabled=False)
+        self.assertEqual(schedule_due_collectors(), 0)
+        self.assertFalse(self._collector_tasks().exists())
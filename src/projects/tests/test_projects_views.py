@@ -367,6 +367,16 @@ class ProjectSourcesViewTests(TestCase):
         self.assertContains(response, "Источники проекта")
         self.assertContains(response, "Добавить источник")
 
+    def test_sources_sorted_by_type_and_title(self) -> None:
+        Source.objects.create(project=self.project, title="Бета", telegram_id=2)
+        Source.objects.create(project=self.project, title="Альфа", telegram_id=1)
+        Source.objects.create(project=self.project, title="Ёж", telegram_id=3)
+        Source.objects.create(project=self.project, title="яблоко", telegram_id=4)
+        Source.objects.create(project=self.project, title="гамма", telegram_id=5)
+        response = self.client.get(reverse("projects:sources", args=[self.project.pk]))
+        titles = [source.title for source in response.context["sources"]]
+        self.assertEqual(titles, ["Альфа", "Бета", "гамма", "Ёж", "яблоко"])
+
     def test_delete_source(self) -> None:
         source = Source.objects.create(project=self.project, title="Temp", username="temp")
         response = self.client.post(
@@ -247,6 +247,38 @@ class WebCollectorTests(TestCase):
         self.assertIn("https://example.com/images/photo.jpg", post.images_manifest)
         self.assertIn("https://cdn.example.com/extra.jpg", post.images_manifest)
 
+    def test_collect_fetches_several_articles(self) -> None:
+        self.fetcher.responses["https://example.com/news"] = """
+        <html><body>
+          <article class="item"><a href="https://example.com/article-1">Первая</a></article>
+          <article class="item"><a href="https://example.com/article-2">Вторая</a></article>
+        </body></html>
+        """
+        self.fetcher.responses["https://example.com/article-2"] = """
+        <html><body>
+          <h1>Вторая новость</h1>
+          <div class="body"><p>Другой текст</p></div>
+        </body></html>
+        """
+        collector = WebCollector(fetcher=self.fetcher)
+        stats = collector.collect(self.source)
+        self.assertEqual(stats["items"], 2)
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(Post.objects.filter(source=self.source).count(), 2)
+
+    def test_collect_skips_failed_article_in_parallel_fetch(self) -> None:
+        self.fetcher.responses["https://example.com/news"] = """
+        <html><body>
+          <article class="item"><a href="https://example.com/article-1">Первая</a></article>
+          <article class="item"><a href="https://example.com/missing">Пропавшая</a></article>
+        </body></html>
+        """
+        collector = WebCollector(fetcher=self.fetcher)
+        stats = collector.collect(self.source)
+        self.assertEqual(stats["items"], 2)
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["skipped"], 1)
+
 
 class CollectProjectWebSourcesTaskTests(TestCase):
     def setUp(self) -> None:
@@ -291,7 +323,19 @@ class CollectProjectWebSourcesTaskTests(TestCase):
         self.assertEqual(result["reason"], "no_sources")
 
     @patch("projects.workers.enqueue_task")
-    def test_task_enqueues_sources_and_requeues(self, mock_enqueue) -> None:
+    def test_task_not_rescheduled_when_presets_broken(self, mock_enqueue) -> None:
+        source = self._add_web_source()
+        WebPreset.objects.filter(pk=source.web_preset_id).update(status=WebPreset.Status.BROKEN)
+        task = WorkerTask.objects.create(
+            queue=WorkerTask.Queue.COLLECTOR_WEB,
+            payload={"project_id": self.project.id, "interval": 60},
+        )
+        result = collect_project_web_sources_task(task)
+        self.assertEqual(result["reason"], "no_sources")
+        mock_enqueue.assert_not_called()
+
+    @patch("projects.workers.enqueue_task")
+    def test_task_enqueues_sources(self, mock_enqueue) -> None:
         source = self._add_web_source()
         task = WorkerTask.objects.create(
             queue=WorkerTask.Queue.COLLECTOR_WEB,
@@ -300,18 +344,11 @@ class CollectProjectWebSourcesTaskTests(TestCase):
         result = collect_project_web_sources_task(task)
         self.assertEqual(result["status"], "scheduled")
         self.assertEqual(result["sources"], 1)
-        self.assertTrue(result["rescheduled"])
-        self.assertGreaterEqual(mock_enqueue.call_count, 2)
-        source_call = mock_enqueue.call_args_list[0]
+        mock_enqueue.assert_called_once()
         self.assertEqual(
-            source_call.kwargs["payload"],
+            mock_enqueue.call_args.kwargs["payload"],
             {"project_id": self.project.id, "source_id": source.id, "interval": 60},
         )
-        scheduler_call = mock_enqueue.call_args_list[-1]
-        self.assertEqual(
-            scheduler_call.kwargs["payload"],
-            {"project_id": self.project.id, "interval": 60},
-        )
 
     @patch("projects.workers.WebCollector.collect")
     def test_task_handles_specific_source_without_reschedule(self, mock_collect) -> None:
@@ -333,6 +370,24 @@ class CollectProjectWebSourcesTaskTests(TestCase):
             .exists()
         )
 
+    @patch("projects.workers.WebCollector.collect")
+    def test_task_marks_broken_preset(self, mock_collect) -> None:
+        source = self._add_web_source()
+        mock_collect.side_effect = PresetValidationError("bad preset")
+        task = WorkerTask.objects.create(
+            queue=WorkerTask.Queue.COLLECTOR_WEB,
+            payload={"project_id": self.project.id, "interval": 60, "source_id": source.id},
+        )
+        collect_project_web_sources_task(task)
+        source.refresh_from_db()
+        self.assertEqual(source.web_last_status, "broken")
+        self.assertIsNotNone(source.web_last_synced_at)
+        self.assertEqual(source.web_preset.status, WebPreset.Status.BROKEN)
+        log = source.sync_logs.get()
+        self.assertEqual(log.status, "failed")
+        self.assertEqual(log.error_message, "bad preset")
+        self.assertIsNotNone(log.finished_at)
+
     @patch("projects.workers.enqueue_task")
     def test_source_retry_overrides_applied(self, mock_enqueue) -> None:
         source = self._add_web_source()
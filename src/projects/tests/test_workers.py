@@ -1,12 +1,15 @@
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from django.test import TestCase
 
+from core.services.worker import get_worker_loop
 from projects.models import Project, Source
 from projects.services.telethon_client import (
     TelethonClientFactory,
     TelethonCredentialsMissingError,
+    telethon_pool,
 )
 from projects.workers import refresh_source_metadata_task
 
@@ -22,20 +25,40 @@ class SourceMetadataWorkerTests(TestCase):
         self.user.save(update_fields=["telethon_api_id", "telethon_api_hash", "telethon_session"])
         self.project = Project.objects.create(owner=self.user, name="Лента")
         self.source = Source.objects.create(project=self.project, username="technews")
+        self.addCleanup(self._close_pool)
 
-    @patch("projects.workers.TelethonClientFactory")
-    def test_refresh_updates_source(self, mock_factory) -> None:
-        async def get_entity(target):
-            return SimpleNamespace(title="Tech News", username="TechNewsRu", id=999)
+    @staticmethod
+    def _close_pool() -> None:
+        get_worker_loop().run_until_complete(telethon_pool.close())
+
+    def _dummy_client(self):
+        class DummyClient:
+            connects = 0
+
+            def __init__(self):
+                self.connected = False
+
+            async def connect(self):
+                DummyClient.connects += 1
+                self.connected = True
+
+            def is_connected(self):
+                return self.connected
+
+            async def is_user_authorized(self):
+                return True
 
-        class DummyContext:
-            async def __aenter__(self):
-                return SimpleNamespace(get_entity=get_entity)
+            async def disconnect(self):
+                self.connected = False
 
-            async def __aexit__(self, exc_type, exc, tb):
-                return False
+            async def get_entity(self, target):
+                return SimpleNamespace(title="Tech News", username="TechNewsRu", id=999)
 
-        mock_factory.return_value.connect.return_value = DummyContext()
+        return DummyClient
+
+    @patch("projects.workers.TelethonClientFactory")
+    def test_refresh_updates_source(self, mock_factory) -> None:
+        mock_factory.return_value.build.side_effect = self._dummy_client()
 
         task = SimpleNamespace(payload={"source_id": self.source.pk})
         result = refresh_source_metadata_task(task)
@@ -46,6 +69,56 @@ class SourceMetadataWorkerTests(TestCase):
         self.assertEqual(self.source.username, "technewsru")
         self.assertEqual(self.source.telegram_id, 999)
 
+    @patch("projects.workers.TelethonClientFactory")
+    def test_refresh_reuses_connected_client(self, mock_factory) -> None:
+        client_cls = self._dummy_client()
+        mock_factory.return_value.build.side_effect = client_cls
+        task = SimpleNamespace(payload={"source_id": self.source.pk})
+
+        refresh_source_metadata_task(task)
+        refresh_source_metadata_task(task)
+
+        self.assertEqual(client_cls.connects, 1)
+        self.assertEqual(mock_factory.return_value.build.call_count, 1)
+
+    @patch("projects.workers.TelethonClientFactory")
+    def test_pool_rejects_foreign_loop_while_holding_clients(self, mock_factory) -> None:
+        mock_factory.return_value.build.side_effect = self._dummy_client()
+        refresh_source_metadata_task(SimpleNamespace(payload={"source_id": self.source.pk}))
+
+        other_loop = asyncio.new_event_loop()
+        self.addCleanup(other_loop.close)
+        with self.assertRaises(RuntimeError):
+            other_loop.run_until_complete(telethon_pool.acquire(mock_factory.return_value))
+        self.assertEqual(len(telethon_pool), 1)
+
+    @patch("projects.workers.TelethonClientFactory")
+    def test_project_refresh_updates_all_sources_in_one_session(self, mock_factory) -> None:
+        client_cls = self._dummy_client()
+
+        async def get_entity(client, target):
+            if target == "missing":
+                raise ValueError("not found")
+            return SimpleNamespace(title=f"Title {target}", username=target, id=None)
+
+        client_cls.get_entity = get_entity
+        mock_factory.return_value.build.side_effect = client_cls
+        other = Source.objects.create(project=self.project, username="worldnews")
+        Source.objects.create(project=self.project, username="missing")
+
+        task = SimpleNamespace(payload={"project_id": self.project.pk})
+        result = refresh_source_metadata_task(task)
+
+        self.assertEqual(result["status"], "ok")
+        self.assertEqual(result["sources"], 3)
+        self.assertEqual(result["updated"], 2)
+        self.assertEqual(result["failed"], 1)
+        self.assertEqual(client_cls.connects, 1)
+        self.source.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(self.source.title, "Title technews")
+        self.assertEqual(other.title, "Title worldnews")
+
     def test_refresh_skips_without_credentials(self) -> None:
         self.user.telethon_api_id = None
         self.user.telethon_api_hash = ""
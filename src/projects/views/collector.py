@@ -31,16 +31,17 @@ class ProjectCollectorQueueView(LoginRequiredMixin, TemplateView):
     def dispatch(self, request, *args, **kwargs):
         """Проверяет права доступа к проекту и инициализирует его."""
         self.project = get_object_or_404(
-            Project,
+            Project.objects.only("id", "name", "owner"),
             pk=kwargs["pk"],
-            owner=request.user,
+            owner_id=request.user.pk,
         )
         return super().dispatch(request, *args, **kwargs)
 
     def post(self, request, *args, **kwargs):
         """Обрабатывает POST-запросы для управления задачами в очереди."""
-        action = request.POST.get("action")
-        task_id = request.POST.get("task_id")
+        post = request.POST
+        action = post.get("action")
+        task_id = post.get("task_id")
         if not task_id or not task_id.isdigit():
             messages.error(request, "Некорректный идентификатор задачи.")
             return redirect("projects:queue", pk=self.project.pk)
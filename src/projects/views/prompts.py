@@ -22,6 +22,14 @@ from projects.services.prompt_config import (
 
 from ..forms import ProjectPromptConfigForm
 
+try:  # pragma: no cover - зависит от окружения
+    import yaml
+
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ModuleNotFoundError:  # pragma: no cover - fallback если зависимость не установлена
+    yaml = None
+    _YamlLoader = None
+
 
 class ProjectPromptsView(LoginRequiredMixin, FormView):
     """Отдельная страница управления основным промтом проекта."""
@@ -32,7 +40,9 @@ class ProjectPromptsView(LoginRequiredMixin, FormView):
     def dispatch(self, request, *args, **kwargs):
         """Проверяет права доступа к проекту и инициализирует конфигурацию промта."""
         self.project = get_object_or_404(
-            Project, pk=kwargs["pk"], owner=request.user
+            Project.objects.only("id", "name", "owner"),
+            pk=kwargs["pk"],
+            owner_id=request.user.pk,
         )
         self.config = ensure_prompt_config(self.project)
         return super().dispatch(request, *args, **kwargs)
@@ -130,9 +140,9 @@ class ProjectPromptImportView(LoginRequiredMixin, View):
 
     def post(self, request, *args, **kwargs):
         project = get_object_or_404(
-            Project,
+            Project.objects.only("id", "owner"),
             pk=kwargs["pk"],
-            owner=request.user,
+            owner_id=request.user.pk,
         )
         file = request.FILES.get("prompt_file")
         payload = (request.POST.get("prompt_payload") or "").strip()
@@ -170,12 +180,9 @@ class ProjectPromptImportView(LoginRequiredMixin, View):
         try:
             return json.loads(payload)
         except json.JSONDecodeError:
-            pass
-        try:
-            import yaml
-        except ModuleNotFoundError:
-            return None
+            if yaml is None:
+                return None
         try:
-            return yaml.safe_load(payload)
+            return yaml.load(payload, Loader=_YamlLoader)
         except yaml.YAMLError:
             return None
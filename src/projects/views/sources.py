@@ -16,6 +16,16 @@ from projects.services.collector_scheduler import ensure_collector_tasks
 
 from ..forms import SourceCreateForm, SourceUpdateForm
 
+# Поля проекта, которые читают списки источников и ensure_collector_tasks.
+_PROJECT_FIELDS = (
+    "id",
+    "name",
+    "owner",
+    "collector_enabled",
+    "collector_telegram_interval",
+    "collector_web_interval",
+)
+
 
 class ProjectSourcesView(LoginRequiredMixin, TemplateView):
     """Список источников проекта с действиями управления."""
@@ -25,19 +35,21 @@ class ProjectSourcesView(LoginRequiredMixin, TemplateView):
     def dispatch(self, request, *args, **kwargs):
         """Проверяет права доступа к проекту и инициализирует его."""
         self.project = get_object_or_404(
-            Project,
+            Project.objects.only(*_PROJECT_FIELDS),
             pk=kwargs["pk"],
-            owner=request.user,
+            owner_id=request.user.pk,
         )
         return super().dispatch(request, *args, **kwargs)
 
     def post(self, request, *args, **kwargs):
         """Поддерживает удаление источника со страницы списка."""
-        if request.POST.get("action") != "delete":
+        post = request.POST
+        action = post.get("action")
+        source_id = post.get("source_id")
+        if action != "delete":
             messages.error(request, "Неизвестное действие.")
             return redirect("projects:sources", pk=self.project.pk)
 
-        source_id = request.POST.get("source_id")
         if not source_id or not source_id.isdigit():
             messages.error(request, "Некорректный идентификатор источника.")
             return redirect("projects:sources", pk=self.project.pk)
@@ -54,7 +66,7 @@ class ProjectSourcesView(LoginRequiredMixin, TemplateView):
         context.update(
             {
                 "project": self.project,
-                "sources": self.project.sources.order_by("type", "title", "telegram_id"),
+                "sources": self._sorted_sources(),
                 "create_url": reverse_lazy(
                     "projects:source-create",
                     kwargs={"project_pk": self.project.pk},
@@ -63,6 +75,39 @@ class ProjectSourcesView(LoginRequiredMixin, TemplateView):
         )
         return context
 
+    def _sorted_sources(self) -> list[Source]:
+        """Возвращает источники проекта, отсортированные в памяти.
+
+        Источников у проекта немного, поэтому сортировка в Python дешевле, чем
+        ORDER BY по неиндексированной комбинации колонок.
+        """
+        sources = (
+            self.project.sources.select_related("web_preset")
+            .only(
+                "id",
+                "project_id",
+                "type",
+                "title",
+                "telegram_id",
+                "username",
+                "invite_link",
+                "created_at",
+                "web_preset__name",
+                "web_preset__title",
+            )
+            .order_by()
+        )
+        return sorted(
+            sources,
+            key=lambda source: (
+                source.type,
+                # Как у ORDER BY с русской сортировкой: без учёта регистра, «ё» рядом с «е».
+                source.title.casefold().replace("ё", "е"),
+                source.telegram_id is None,
+                source.telegram_id or 0,
+            ),
+        )
+
 
 class ProjectSourceDetailView(LoginRequiredMixin, DetailView):
     """Страница просмотра детальной информации об источнике."""
@@ -245,7 +290,11 @@ class ProjectSourceUpdateView(LoginRequiredMixin, UpdateView):
 @require_POST
 def delete_source(request, project_pk: int, pk: int):
     """Удаляет источник и перенаправляет на список источников."""
-    project = get_object_or_404(Project, pk=project_pk, owner=request.user)
+    project = get_object_or_404(
+        Project.objects.only(*_PROJECT_FIELDS),
+        pk=project_pk,
+        owner_id=request.user.pk,
+    )
     source = get_object_or_404(Source, pk=pk, project=project)
     source.delete()
     ensure_collector_tasks(project)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+import functools
 from typing import Any
 
 from django.db import transaction
@@ -11,18 +11,23 @@ from django.utils import timezone
 
 from core.logging import event_logger, logging_context
 from core.models import WorkerTask
-from core.services.worker import TaskExecutionError, enqueue_task, register_handler
+from core.services.worker import (
+    TaskExecutionError,
+    enqueue_task,
+    get_worker_loop,
+    register_handler,
+)
 from projects.models import Project, Source, SourceSyncLog, WebPreset
 from projects.services.collector import collect_for_user
 from projects.services.retention import purge_expired_posts
 from projects.services.telethon_client import (
     TelethonClientFactory,
     TelethonCredentialsMissingError,
+    telethon_pool,
 )
 from projects.services.web_collector import WebCollector
 from projects.services.web_preset_registry import PresetValidationError
 
-_is_registered = False
 logger = event_logger("projects.collector_web")
 
 
@@ -39,7 +44,7 @@ def retention_cleanup_task(task: WorkerTask) -> dict[str, Any]:
         )
 
     try:
-        project = Project.objects.get(pk=project_id)
+        project = Project.objects.only("id", "is_active", "retention_days").get(pk=project_id)
     except Project.DoesNotExist as exc:
         raise TaskExecutionError(
             "Проект не найден",
@@ -56,17 +61,29 @@ def retention_cleanup_task(task: WorkerTask) -> dict[str, Any]:
     return {"status": "ok", "removed": removed}
 
 
+@functools.cache
 def register_project_workers() -> None:
     """Гарантирует, что обработчики очереди обслуживания зарегистрированы."""
 
-    global _is_registered
-    if _is_registered:
-        return
     register_handler(WorkerTask.Queue.COLLECTOR, collect_project_posts_task)
     register_handler(WorkerTask.Queue.COLLECTOR_WEB, collect_project_web_sources_task)
     register_handler(WorkerTask.Queue.MAINTENANCE, retention_cleanup_task)
     register_handler(WorkerTask.Queue.SOURCE, refresh_source_metadata_task)
-    _is_registered = True
+
+
+def close_telethon_pool() -> None:
+    """Отключает Telethon клиенты, накопленные воркером, при завершении процесса.
+
+    Регистрируется через ``atexit`` командами запуска воркеров.
+    """
+
+    if not telethon_pool:
+        return
+    loop = get_worker_loop()
+    try:
+        loop.run_until_complete(telethon_pool.close())
+    except Exception:  # pragma: no cover - процесс всё равно завершается
+        logger.warning("telethon_pool_close_failed")
 
 
 def refresh_source_metadata_task(task: WorkerTask) -> dict[str, Any]:
@@ -74,6 +91,8 @@ def refresh_source_metadata_task(task: WorkerTask) -> dict[str, Any]:
 
     payload = task.payload or {}
     source_id = payload.get("source_id")
+    if not source_id and payload.get("project_id"):
+        return refresh_project_sources_task(task)
     if not source_id:
         raise TaskExecutionError(
             "Payload must contain source_id",
@@ -96,12 +115,17 @@ def refresh_source_metadata_task(task: WorkerTask) -> dict[str, Any]:
         return {"status": "skipped", "reason": "no_identifier"}
 
     async def runner():
-        factory = TelethonClientFactory(user=owner)
-        async with factory.connect() as client:
+        client = await telethon_pool.acquire(TelethonClientFactory(user=owner))
+        try:
             return await client.get_entity(target)
+        except ValueError:
+            raise
+        except Exception:
+            await telethon_pool.discard(owner)
+            raise
 
     try:
-        entity = asyncio.run(runner())
+        entity = get_worker_loop().run_until_complete(runner())
     except TelethonCredentialsMissingError as exc:
         raise TaskExecutionError(str(exc), code="AUTH_ERROR", retry=False) from exc
     except ValueError as exc:
@@ -109,11 +133,30 @@ def refresh_source_metadata_task(task: WorkerTask) -> dict[str, Any]:
     except Exception as exc:  # pragma: no cover - defensive logging
         raise TaskExecutionError(str(exc), code="SOURCE_REFRESH_ERROR") from exc
 
+    updates = _source_metadata_updates(source, entity)
+    if updates:
+        Source.objects.filter(pk=source.pk).update(**updates)
+
+    return {"status": "ok", "updated": bool(updates)}
+
+
+def _entity_title(entity: Any) -> str | None:
+    """Название канала/чата или имя пользователя Telegram."""
+
     title = getattr(entity, "title", None)
-    if not title:
-        first_name = getattr(entity, "first_name", "")
-        last_name = getattr(entity, "last_name", "")
-        title = " ".join(filter(None, [first_name, last_name]))
+    if title:
+        return title
+    first_name = getattr(entity, "first_name", None)
+    last_name = getattr(entity, "last_name", None)
+    if first_name and last_name:
+        return f"{first_name} {last_name}"
+    return first_name or last_name or None
+
+
+def _source_metadata_updates(source: Source, entity: Any) -> dict[str, Any]:
+    """Сравнивает источник с сущностью Telegram и возвращает изменившиеся поля."""
+
+    title = _entity_title(entity)
     username = getattr(entity, "username", None) or source.username
     telegram_id = getattr(entity, "id", None) or source.telegram_id
 
@@ -124,10 +167,81 @@ def refresh_source_metadata_task(task: WorkerTask) -> dict[str, Any]:
         updates["username"] = username.lower()
     if telegram_id and source.telegram_id != telegram_id:
         updates["telegram_id"] = telegram_id
-    if updates:
-        Source.objects.filter(pk=source.pk).update(**updates)
+    return updates
 
-    return {"status": "ok", "updated": bool(updates)}
+
+def refresh_project_sources_task(task: WorkerTask) -> dict[str, Any]:
+    """Обновляет метаданные всех Telegram-источников проекта в одной сессии Telethon."""
+
+    payload = task.payload or {}
+    project_id = payload.get("project_id")
+    try:
+        project = Project.objects.select_related("owner").only("id", "owner").get(pk=project_id)
+    except Project.DoesNotExist as exc:
+        raise TaskExecutionError("Проект не найден", code="NOT_FOUND", retry=False) from exc
+
+    owner = project.owner
+    if not owner.has_telethon_credentials:
+        return {"status": "skipped", "reason": "no_credentials"}
+
+    sources = [
+        source
+        for source in Source.objects.filter(
+            project_id=project.pk,
+            is_active=True,
+            type=Source.Type.TELEGRAM,
+        ).only("id", "project_id", "username", "telegram_id", "invite_link", "title")
+        if source.username or source.telegram_id or source.invite_link
+    ]
+    if not sources:
+        return {"status": "skipped", "reason": "no_sources"}
+
+    async def runner():
+        client = await telethon_pool.acquire(TelethonClientFactory(user=owner))
+        results = await asyncio.gather(
+            *(
+                client.get_entity(source.username or source.telegram_id or source.invite_link)
+                for source in sources
+            ),
+            return_exceptions=True,
+        )
+        if any(
+            isinstance(result, Exception) and not isinstance(result, ValueError)
+            for result in results
+        ):
+            await telethon_pool.discard(owner)
+        return results
+
+    try:
+        entities = get_worker_loop().run_until_complete(runner())
+    except TelethonCredentialsMissingError as exc:
+        raise TaskExecutionError(str(exc), code="AUTH_ERROR", retry=False) from exc
+    except Exception as exc:  # pragma: no cover - defensive logging
+        raise TaskExecutionError(str(exc), code="SOURCE_REFRESH_ERROR") from exc
+
+    changed: list[Source] = []
+    dirty_fields: set[str] = set()
+    failed = 0
+    for source, entity in zip(sources, entities, strict=True):
+        if isinstance(entity, Exception):
+            failed += 1
+            logger.warning(
+                "source_metadata_refresh_failed",
+                project_id=project.pk,
+                source_id=source.pk,
+                error=str(entity),
+            )
+            continue
+        updates = _source_metadata_updates(source, entity)
+        if updates:
+            for field, value in updates.items():
+                setattr(source, field, value)
+            dirty_fields.update(updates)
+            changed.append(source)
+    if changed:
+        Source.objects.bulk_update(changed, sorted(dirty_fields), batch_size=500)
+
+    return {"status": "ok", "sources": len(sources), "updated": len(changed), "failed": failed}
 
 
 def collect_project_posts_task(task: WorkerTask) -> dict[str, Any]:
@@ -135,7 +249,6 @@ def collect_project_posts_task(task: WorkerTask) -> dict[str, Any]:
 
     payload = task.payload or {}
     project_id = payload.get("project_id")
-    interval = max(int(payload.get("interval", 300)), 30)
     if not project_id:
         raise TaskExecutionError(
             "Payload must contain project_id",
@@ -144,7 +257,11 @@ def collect_project_posts_task(task: WorkerTask) -> dict[str, Any]:
         )
 
     try:
-        project = Project.objects.select_related("owner").get(pk=project_id)
+        project = (
+            Project.objects.select_related("owner")
+            .only("id", "is_active", "collector_enabled", "owner")
+            .get(pk=project_id)
+        )
     except Project.DoesNotExist as exc:
         raise TaskExecutionError(
             "Проект не найден",
@@ -169,7 +286,7 @@ def collect_project_posts_task(task: WorkerTask) -> dict[str, Any]:
 
     with logging_context(project_id=project.pk, user_id=owner.pk):
         try:
-            asyncio.run(runner())
+            get_worker_loop().run_until_complete(runner())
         except TelethonCredentialsMissingError as exc:
             raise TaskExecutionError(str(exc), code="AUTH_ERROR", retry=False) from exc
         except Exception as exc:  # pragma: no cover - защитный слой
@@ -181,15 +298,18 @@ def collect_project_posts_task(task: WorkerTask) -> dict[str, Any]:
         updated_at=now,
     )
 
-    if project.collector_enabled:
-        scheduled_for = now + timedelta(seconds=interval)
-        enqueue_task(
-            WorkerTask.Queue.COLLECTOR,
-            payload={"project_id": project.pk, "interval": interval},
-            scheduled_for=scheduled_for,
-        )
+    # Следующий запуск ставит периодический планировщик (schedule_collectors).
+    return {"status": "ok"}
 
-    return {"status": "ok", "next_run_in": interval}
+
+def _eligible_web_sources():
+    """Веб-источники, которые сборщик может обработать."""
+
+    return Source.objects.filter(
+        is_active=True,
+        type=Source.Type.WEB,
+        web_preset__status=WebPreset.Status.ACTIVE,
+    )
 
 
 def collect_project_web_sources_task(task: WorkerTask) -> dict[str, Any]:
@@ -213,7 +333,7 @@ def collect_project_web_sources_task(task: WorkerTask) -> dict[str, Any]:
             retry=False,
         )
     try:
-        project = Project.objects.prefetch_related("sources__web_preset").get(pk=project_id)
+        project = Project.objects.get(pk=project_id)
     except Project.DoesNotExist as exc:
         raise TaskExecutionError(
             "Проект не найден",
@@ -226,25 +346,23 @@ def collect_project_web_sources_task(task: WorkerTask) -> dict[str, Any]:
     if not project.collector_enabled and not source_id:
         logger.info("collector_web_task_skipped", project_id=project.pk, reason="disabled")
         return {"status": "skipped", "reason": "disabled"}
-    sources_qs = project.sources.filter(
-        is_active=True,
-        type=Source.Type.WEB,
-        web_preset__status=WebPreset.Status.ACTIVE,
-    ).select_related("web_preset")
-
-    if source_id:
-        sources_qs = sources_qs.filter(pk=source_id)
-    sources = list(sources_qs)
-
-    if source_id and not sources:
-        raise TaskExecutionError(
-            "Источник не найден или отключён",
-            code="SOURCE_MISSING",
-            retry=False,
-        )
 
     if not source_id:
-        if not sources:
+        # Для постановки задач пресеты не нужны: читаем источники порциями,
+        # чтобы память не росла вместе с числом источников проекта.
+        sources_qs = (
+            _eligible_web_sources()
+            .filter(project_id=project.pk)
+            .only(
+                "id",
+                "web_retry_max_attempts",
+                "web_retry_base_delay",
+                "web_retry_max_delay",
+            )
+            .order_by("pk")
+        )
+        if not sources_qs.exists():
+            # Без подходящих источников не перезапускаем задачу, чтобы не крутить пустой цикл.
             logger.info("collector_web_task_skipped", project_id=project.pk, reason="no_sources")
             return {"status": "skipped", "reason": "no_sources"}
 
@@ -282,25 +400,23 @@ def collect_project_web_sources_task(task: WorkerTask) -> dict[str, Any]:
                 max_delay=source.web_retry_max_delay,
             )
 
-        for source in sources:
+        for source in sources_qs.iterator(chunk_size=200):
             _enqueue_source_task(source)
             enqueued += 1
 
-        should_schedule = project.collector_enabled
-        if should_schedule:
-            scheduled_for = timezone.now() + timedelta(seconds=interval)
-            enqueue_task(
-                WorkerTask.Queue.COLLECTOR_WEB,
-                payload={"project_id": project.pk, "interval": interval},
-                scheduled_for=scheduled_for,
-            )
-            logger.info(
-                "collector_web_task_rescheduled",
-                project_id=project.pk,
-                interval=interval,
-                next_run=scheduled_for.isoformat(),
-            )
-        return {"status": "scheduled", "sources": enqueued, "rescheduled": should_schedule}
+        return {"status": "scheduled", "sources": enqueued}
+
+    sources = list(
+        _eligible_web_sources()
+        .filter(project_id=project.pk, pk=source_id)
+        .select_related("web_preset")
+    )
+    if not sources:
+        raise TaskExecutionError(
+            "Источник не найден или отключён",
+            code="SOURCE_MISSING",
+            retry=False,
+        )
 
     collector = WebCollector()
     summary = {"created": 0, "updated": 0, "skipped": 0}
@@ -310,83 +426,73 @@ def collect_project_web_sources_task(task: WorkerTask) -> dict[str, Any]:
         source_count=len(sources),
         source_id=source_id,
     )
-    for source in sources:
-        log = SourceSyncLog.objects.create(source=source)
-        with logging_context(project_id=project.pk, source_id=source.pk):
-            logger.info(
-                "collector_web_source_started",
-                source_id=source.pk,
-                project_id=project.pk,
-                preset_id=source.web_preset_id,
-            )
-            try:
-                stats = collector.collect(source)
-            except PresetValidationError as exc:
-                log.finish(status="failed", error=str(exc))
-                WebPreset.objects.filter(pk=source.web_preset_id).update(
-                    status=WebPreset.Status.BROKEN,
-                    updated_at=timezone.now(),
-                )
-                Source.objects.filter(pk=source.pk).update(
-                    web_last_status="broken",
-                    web_last_synced_at=timezone.now(),
-                    updated_at=timezone.now(),
-                )
-                logger.warning(
-                    "collector_web_source_broken",
+    try:
+        for source in sources:
+            log = SourceSyncLog.objects.create(source=source)
+            with logging_context(project_id=project.pk, source_id=source.pk):
+                logger.info(
+                    "collector_web_source_started",
                     source_id=source.pk,
                     project_id=project.pk,
-                    error=str(exc),
+                    preset_id=source.web_preset_id,
                 )
-                continue
-            except Exception as exc:  # pragma: no cover - defensive logging
-                log.finish(status="failed", error=str(exc))
-                Source.objects.filter(pk=source.pk).update(
-                    web_last_status="failed",
-                    web_last_synced_at=timezone.now(),
-                    updated_at=timezone.now(),
-                )
-                logger.error(
-                    "collector_web_source_error",
+                try:
+                    stats = collector.collect(source)
+                except PresetValidationError as exc:
+                    finished_at = timezone.now()
+                    log.finish(status="failed", error=str(exc), at=finished_at)
+                    WebPreset.objects.filter(pk=source.web_preset_id).update(
+                        status=WebPreset.Status.BROKEN,
+                        updated_at=finished_at,
+                    )
+                    Source.objects.filter(pk=source.pk).update(
+                        web_last_status="broken",
+                        web_last_synced_at=finished_at,
+                        updated_at=finished_at,
+                    )
+                    logger.warning(
+                        "collector_web_source_broken",
+                        source_id=source.pk,
+                        project_id=project.pk,
+                        error=str(exc),
+                    )
+                    continue
+                except Exception as exc:  # pragma: no cover - defensive logging
+                    finished_at = timezone.now()
+                    log.finish(status="failed", error=str(exc), at=finished_at)
+                    Source.objects.filter(pk=source.pk).update(
+                        web_last_status="failed",
+                        web_last_synced_at=finished_at,
+                        updated_at=finished_at,
+                    )
+                    logger.error(
+                        "collector_web_source_error",
+                        source_id=source.pk,
+                        project_id=project.pk,
+                        error=str(exc),
+                    )
+                    continue
+                fetched = stats.get("created", 0) + stats.get("updated", 0)
+                log.finish(status="ok", fetched=fetched, skipped=stats.get("skipped", 0))
+                summary["created"] += stats.get("created", 0)
+                summary["updated"] += stats.get("updated", 0)
+                summary["skipped"] += stats.get("skipped", 0)
+                logger.info(
+                    "collector_web_source_finished",
                     source_id=source.pk,
                     project_id=project.pk,
-                    error=str(exc),
+                    created=stats.get("created", 0),
+                    updated=stats.get("updated", 0),
+                    skipped=stats.get("skipped", 0),
                 )
-                continue
-            fetched = stats.get("created", 0) + stats.get("updated", 0)
-            log.finish(status="ok", fetched=fetched, skipped=stats.get("skipped", 0))
-            summary["created"] += stats.get("created", 0)
-            summary["updated"] += stats.get("updated", 0)
-            summary["skipped"] += stats.get("skipped", 0)
-            logger.info(
-                "collector_web_source_finished",
-                source_id=source.pk,
-                project_id=project.pk,
-                created=stats.get("created", 0),
-                updated=stats.get("updated", 0),
-                skipped=stats.get("skipped", 0),
-            )
+    finally:
+        collector.close()
 
-    should_schedule = project.collector_enabled and not source_id
-    if should_schedule:
-        scheduled_for = timezone.now() + timedelta(seconds=interval)
-        enqueue_task(
-            WorkerTask.Queue.COLLECTOR_WEB,
-            payload={"project_id": project.pk, "interval": interval},
-            scheduled_for=scheduled_for,
-        )
-        logger.info(
-            "collector_web_task_rescheduled",
-            project_id=project.pk,
-            interval=interval,
-            next_run=scheduled_for.isoformat(),
-        )
     logger.info(
         "collector_web_task_completed",
         project_id=project.pk,
         created=summary["created"],
         updated=summary["updated"],
         skipped=summary["skipped"],
-        rescheduled=should_schedule,
     )
     return {"status": "ok", **summary}
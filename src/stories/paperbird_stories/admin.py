@@ -21,6 +21,7 @@ class StoryAdmin(admin.ModelAdmin):
         "last_rewrite_preset",
         "updated_at",
     )
+    list_select_related = ("project", "last_rewrite_preset__project")
     list_filter = ("status", "project")
     search_fields = ("title", "project__name")
     inlines = [StoryPostInline]
@@ -44,6 +45,7 @@ class RewriteTaskAdmin(admin.ModelAdmin):
         "preset",
         "created_at",
     )
+    list_select_related = ("story", "preset__project")
     list_filter = ("status", "provider", "preset")
     search_fields = ("story__title", "response_id")
     readonly_fields = (
@@ -62,6 +64,7 @@ class RewriteTaskAdmin(admin.ModelAdmin):
 @admin.register(StoryPost)
 class StoryPostAdmin(admin.ModelAdmin):
     list_display = ("id", "story", "post", "position", "added_at")
+    list_select_related = ("story", "post__source")
     list_filter = ("story__project",)
     search_fields = ("story__title", "post__message")
     readonly_fields = ("added_at",)
@@ -70,6 +73,7 @@ class StoryPostAdmin(admin.ModelAdmin):
 @admin.register(Publication)
 class PublicationAdmin(admin.ModelAdmin):
     list_display = ("id", "story", "target", "status", "published_at")
+    list_select_related = ("story",)
     list_filter = ("status", "target")
     search_fields = ("story__title", "target")
     readonly_fields = (
@@ -94,6 +98,7 @@ class RewritePresetAdmin(admin.ModelAdmin):
         "is_active",
         "updated_at",
     )
+    list_select_related = ("project",)
     list_filter = ("project", "is_active")
     search_fields = ("name", "project__name", "description", "style")
     ordering = ("project", "name")
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import base64
 import binascii
+import re
+import tempfile
 from typing import Any
 
 from django import forms
 from django.db import models
+from django.db.models import Prefetch
 from django.utils import timezone
 
 from core.constants import (
@@ -17,10 +19,85 @@ from core.constants import (
     IMAGE_QUALITY_CHOICES,
     IMAGE_SIZE_CHOICES,
 )
-from stories.paperbird_stories.models import Publication, RewritePreset, Story
+from stories.paperbird_stories.models import (
+    _IMAGE_EXTENSIONS,
+    Publication,
+    RewritePreset,
+    Story,
+)
+
+_LOCAL_FMT = "%Y-%m-%dT%H:%M"
+# Декодированное изображение до 1 МБ держим в памяти, крупнее — во временном файле.
+_IMAGE_SPOOL_MAX_SIZE = 1 << 20
+# Кратно 4, чтобы каждый кусок base64 декодировался независимо.
+_BASE64_CHUNK = 1 << 16
+# Те же форматы, для которых модель знает расширение файла.
+_ALLOWED_IMAGE_MIMES = frozenset(_IMAGE_EXTENSIONS)
+_TG_TARGET_RE = re.compile(r"(?:https?://)?(?:t\.me/)?/*(?P<rest>.*?)/*", re.IGNORECASE)
+_ASPECT_RATIO_CHOICES = (("", "По умолчанию"),) + tuple(
+    (ratio, ratio) for ratio in GEMINI_IMAGE_ASPECT_RATIOS
+)
+_IMAGE_SIZE_CHOICES = (("", "По умолчанию"),) + tuple(
+    (size, size) for size in GEMINI_IMAGE_SIZES
+)
+
+
+# Подгружает активные пресеты проекта вместе с сюжетами; формы рерайта берут их
+# из ``story.project.active_presets`` вместо отдельного запроса на каждый сюжет.
+ACTIVE_PRESETS_PREFETCH = Prefetch(
+    "project__rewrite_presets",
+    queryset=RewritePreset.objects.filter(is_active=True)
+    .only("id", "name", "project_id")
+    .order_by("name"),
+    to_attr="active_presets",
+)
 
 
-class StoryRewriteForm(forms.Form):
+def _normalize_tg_target(target: str) -> str:
+    """Приводит ссылку или имя канала к виду ``@channel`` (ID чатов с ``-`` не трогает)."""
+
+    match = _TG_TARGET_RE.fullmatch(target)
+    rest = match.group("rest") if match else target
+    if rest and rest[0] not in "@-":
+        rest = f"@{rest}"
+    return rest
+
+
+class _StoryPresetsMixin:
+    """Загружает активные пресеты проекта сюжета один раз на форму."""
+
+    _presets_by_pk: dict[int, RewritePreset]
+
+    def _bind_presets(self, story: Story | None) -> None:
+        if story is None:
+            # Объявленное поле уже содержит пустой queryset — новый не создаём.
+            self._presets_by_pk = {}
+            return
+        field = self.fields["preset"]
+        presets = getattr(story.project, "active_presets", None)
+        if presets is None:
+            # Для подписей опций нужны только имя и проект; тяжёлые текстовые поля
+            # пресета (промпты, комментарии) здесь не читаем.
+            presets = list(story.active_rewrite_presets.only("id", "name", "project_id"))
+        for preset in presets:
+            preset.project = story.project
+        self._presets_by_pk = {preset.pk: preset for preset in presets}
+        field.queryset = story.active_rewrite_presets
+        # Варианты виджета берём из уже загруженного списка, чтобы рендер
+        # не выполнял тот же SELECT повторно.
+        iterator = field.iterator(field)
+        choices = [("", field.empty_label)] if field.empty_label is not None else []
+        field.choices = choices + [iterator.choice(preset) for preset in presets]
+
+    def _cached_preset(self, value: Any) -> RewritePreset | None:
+        # Пресет вне активного списка форма всё равно не примет, поэтому в БД не ходим.
+        try:
+            return self._presets_by_pk[int(value)]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+class StoryRewriteForm(_StoryPresetsMixin, forms.Form):
     """Форма для выбора пресета рерайта и ввода комментария."""
     preset = forms.ModelChoiceField(
         label="Пресет",
@@ -38,15 +115,12 @@ class StoryRewriteForm(forms.Form):
     def __init__(self, *args: Any, story: Story | None = None, **kwargs: Any) -> None:
         """Инициализирует форму, фильтруя пресеты по проекту."""
         super().__init__(*args, **kwargs)
-        presets = RewritePreset.objects.none()
-        if story is not None:
-            presets = story.project.rewrite_presets.filter(is_active=True).order_by("name")
-            if story.last_rewrite_preset:
-                self.fields["preset"].initial = story.last_rewrite_preset
-        self.fields["preset"].queryset = presets
+        self._bind_presets(story)
+        if story is not None and story.last_rewrite_preset:
+            self.fields["preset"].initial = story.last_rewrite_preset
 
 
-class StoryPromptConfirmForm(forms.Form):
+class StoryPromptConfirmForm(_StoryPresetsMixin, forms.Form):
     """Форма подтверждения промпта перед отправкой на рерайт."""
 
     prompt_system = forms.CharField(
@@ -72,10 +146,7 @@ class StoryPromptConfirmForm(forms.Form):
     def __init__(self, *args: Any, story: Story | None = None, **kwargs: Any) -> None:
         """Инициализирует форму, фильтруя пресеты по проекту."""
         super().__init__(*args, **kwargs)
-        presets = RewritePreset.objects.none()
-        if story is not None:
-            presets = story.project.rewrite_presets.filter(is_active=True).order_by("name")
-        self.fields["preset"].queryset = presets
+        self._bind_presets(story)
 
     @property
     def selected_preset(self) -> RewritePreset | None:
@@ -88,18 +159,12 @@ class StoryPromptConfirmForm(forms.Form):
         if self.is_bound:
             value = self.data.get("preset")
             if value:
-                try:
-                    return self.fields["preset"].queryset.get(pk=value)
-                except (RewritePreset.DoesNotExist, ValueError, TypeError):
-                    return None
+                return self._cached_preset(value)
         initial_value = self.initial.get("preset")
         if isinstance(initial_value, RewritePreset):
             return initial_value
         if initial_value:
-            try:
-                return self.fields["preset"].queryset.get(pk=initial_value)
-            except (RewritePreset.DoesNotExist, ValueError, TypeError):
-                return None
+            return self._cached_preset(initial_value)
         return None
 
     @property
@@ -131,7 +196,7 @@ class StoryPublishForm(forms.Form):
     publish_at = forms.DateTimeField(
         label="Запланировать на",
         required=False,
-        input_formats=["%Y-%m-%dT%H:%M"],
+        input_formats=[_LOCAL_FMT],
         help_text="Оставьте пустым, чтобы опубликовать сразу",
         widget=forms.DateTimeInput(
             attrs={"type": "datetime-local", "class": "form-control"}
@@ -145,16 +210,18 @@ class StoryPublishForm(forms.Form):
         widget=forms.RadioSelect,
     )
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._tz = timezone.get_current_timezone()
+
     def clean_publish_at(self):
         """Проверяет, что время публикации находится в будущем."""
         publish_at = self.cleaned_data.get("publish_at")
         if publish_at is None:
             return None
         if timezone.is_naive(publish_at):
-            publish_at = timezone.make_aware(
-                publish_at, timezone.get_current_timezone()
-            )
-        publish_at = publish_at.astimezone(timezone.get_current_timezone())
+            publish_at = timezone.make_aware(publish_at, self._tz)
+        publish_at = publish_at.astimezone(self._tz)
         if publish_at <= timezone.now():
             raise forms.ValidationError("Укажите время в будущем")
         return publish_at
@@ -164,14 +231,7 @@ class StoryPublishForm(forms.Form):
         target = (self.cleaned_data.get("target") or "").strip()
         if not target:
             raise forms.ValidationError("Укажите канал или чат для публикации")
-        normalized = target
-        if normalized.startswith(("http://", "https://")):
-            if "t.me/" in normalized:
-                normalized = normalized.split("t.me/", 1)[1]
-            normalized = normalized.strip("/")
-        if normalized and not normalized.startswith("@") and not normalized.startswith("-"):
-            normalized = f"@{normalized}"
-        return normalized
+        return _normalize_tg_target(target)
 
     def clean_media_order(self) -> str:
         """Возвращает порядок медиа или значение по умолчанию."""
@@ -181,7 +241,34 @@ class StoryPublishForm(forms.Form):
         return value
 
 
-class StoryContentForm(forms.ModelForm):
+class _ChangedFieldsSaveMixin:
+    """Сохраняет существующий объект только по изменившимся полям формы."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._original_values = {
+            name: getattr(self.instance, name, None) for name in self._meta.fields
+        }
+
+    def save(self, commit: bool = True):
+        if not commit or self.instance._state.adding:
+            return super().save(commit=commit)
+        instance = super().save(commit=False)
+        # Сравниваем значения экземпляра, а не changed_data: clean() может
+        # заполнить поле сам (например, published_at при статусе «Опубликована»).
+        update_fields = [
+            name
+            for name, original in self._original_values.items()
+            if getattr(instance, name, None) != original
+        ]
+        if update_fields:
+            if any(field.name == "updated_at" for field in instance._meta.concrete_fields):
+                update_fields.append("updated_at")
+            instance.save(update_fields=update_fields)
+        return instance
+
+
+class StoryContentForm(_ChangedFieldsSaveMixin, forms.ModelForm):
     """Редактирование заголовка и текста сюжета."""
 
     class Meta:
@@ -237,15 +324,13 @@ class StoryImageGenerateForm(forms.Form):
     )
     aspect_ratio = forms.ChoiceField(
         label="Соотношение сторон (Gemini)",
-        choices=(("", "По умолчанию"),)
-        + tuple((ratio, ratio) for ratio in GEMINI_IMAGE_ASPECT_RATIOS),
+        choices=_ASPECT_RATIO_CHOICES,
         widget=forms.Select(attrs={"class": "form-select"}),
         required=False,
     )
     image_size = forms.ChoiceField(
         label="Разрешение (Gemini)",
-        choices=(("", "По умолчанию"),)
-        + tuple((size, size) for size in GEMINI_IMAGE_SIZES),
+        choices=_IMAGE_SIZE_CHOICES,
         widget=forms.Select(attrs={"class": "form-select"}),
         required=False,
     )
@@ -258,39 +343,28 @@ class StoryImageGenerateForm(forms.Form):
         return prompt
 
 
+class _HiddenChoiceField(forms.ChoiceField):
+    """Скрытый ChoiceField: значение проверяется по множеству, а не обходом списка."""
+
+    def __init__(self, *, choices: Any, **kwargs: Any) -> None:
+        super().__init__(choices=choices, widget=forms.HiddenInput(), **kwargs)
+        self._allowed = frozenset(str(key) for key, _ in self.choices)
+
+    def valid_value(self, value: Any) -> bool:
+        return str(value) in self._allowed
+
+
 class StoryImageAttachForm(forms.Form):
     """Форма для прикрепления сгенерированного изображения."""
     prompt = forms.CharField(widget=forms.HiddenInput())
-    image_data = forms.CharField(widget=forms.HiddenInput(), required=False)
+    image_data = forms.CharField(widget=forms.HiddenInput(), required=False, strip=False)
     mime_type = forms.CharField(widget=forms.HiddenInput())
     preview_token = forms.CharField(widget=forms.HiddenInput(), required=False)
-    model = forms.ChoiceField(
-        choices=IMAGE_MODEL_CHOICES,
-        widget=forms.HiddenInput(),
-        required=False,
-    )
-    size = forms.ChoiceField(
-        choices=IMAGE_SIZE_CHOICES,
-        widget=forms.HiddenInput(),
-        required=False,
-    )
-    quality = forms.ChoiceField(
-        choices=IMAGE_QUALITY_CHOICES,
-        widget=forms.HiddenInput(),
-        required=False,
-    )
-    aspect_ratio = forms.ChoiceField(
-        choices=(("", "По умолчанию"),)
-        + tuple((ratio, ratio) for ratio in GEMINI_IMAGE_ASPECT_RATIOS),
-        widget=forms.HiddenInput(),
-        required=False,
-    )
-    image_size = forms.ChoiceField(
-        choices=(("", "По умолчанию"),)
-        + tuple((size, size) for size in GEMINI_IMAGE_SIZES),
-        widget=forms.HiddenInput(),
-        required=False,
-    )
+    model = _HiddenChoiceField(choices=IMAGE_MODEL_CHOICES, required=False)
+    size = _HiddenChoiceField(choices=IMAGE_SIZE_CHOICES, required=False)
+    quality = _HiddenChoiceField(choices=IMAGE_QUALITY_CHOICES, required=False)
+    aspect_ratio = _HiddenChoiceField(choices=_ASPECT_RATIO_CHOICES, required=False)
+    image_size = _HiddenChoiceField(choices=_IMAGE_SIZE_CHOICES, required=False)
 
     def clean_prompt(self):
         value = self.cleaned_data["prompt"].strip()
@@ -299,20 +373,32 @@ class StoryImageAttachForm(forms.Form):
         return value
 
     def clean_image_data(self):
-        raw = self.cleaned_data["image_data"].strip()
+        # Полезная нагрузка может весить мегабайты: обрезаем пробелы только если они
+        # действительно есть по краям. Строгий режим binascii проверяет алфавит за
+        # тот же проход, что и декодирует, без отдельного regex и копии в bytes.
+        raw = self.cleaned_data["image_data"]
+        if raw[:1].isspace() or raw[-1:].isspace():
+            raw = raw.strip()
         if not raw:
             return b""
+        buffer = tempfile.SpooledTemporaryFile(max_size=_IMAGE_SPOOL_MAX_SIZE)
         try:
-            data = base64.b64decode(raw, validate=True)
+            for start in range(0, len(raw), _BASE64_CHUNK):
+                buffer.write(
+                    binascii.a2b_base64(raw[start : start + _BASE64_CHUNK], strict_mode=True)
+                )
         except (binascii.Error, ValueError) as exc:
+            buffer.close()
             raise forms.ValidationError("Некорректные данные изображения") from exc
-        if not data:
+        if not buffer.tell():
+            buffer.close()
             raise forms.ValidationError("Отсутствуют данные изображения")
-        return data
+        buffer.seek(0)
+        return buffer
 
     def clean_mime_type(self):
-        mime_type = self.cleaned_data["mime_type"].strip()
-        if not mime_type.startswith("image/"):
+        mime_type = self.cleaned_data["mime_type"].lower()
+        if mime_type not in _ALLOWED_IMAGE_MIMES:
             raise forms.ValidationError("Неподдерживаемый тип файла")
         return mime_type
 
@@ -337,13 +423,13 @@ class StoryImageUploadForm(forms.Form):
     )
 
 
-class PublicationManageForm(forms.ModelForm):
+class PublicationManageForm(_ChangedFieldsSaveMixin, forms.ModelForm):
     """Форма для ручного управления публикацией."""
 
     scheduled_for = forms.DateTimeField(
         label="Запланировано",
         required=False,
-        input_formats=["%Y-%m-%dT%H:%M"],
+        input_formats=[_LOCAL_FMT],
         widget=forms.DateTimeInput(
             attrs={"type": "datetime-local", "class": "form-control"}
         ),
@@ -355,7 +441,7 @@ class PublicationManageForm(forms.ModelForm):
     published_at = forms.DateTimeField(
         label="Опубликовано",
         required=False,
-        input_formats=["%Y-%m-%dT%H:%M"],
+        input_formats=[_LOCAL_FMT],
         widget=forms.DateTimeInput(
             attrs={"type": "datetime-local", "class": "form-control"}
         ),
@@ -404,51 +490,43 @@ class PublicationManageForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._tz = timezone.get_current_timezone()
         if not self.is_bound:
+            instance = self.instance
             for field_name in ("scheduled_for", "published_at"):
-                value = getattr(self.instance, field_name, None)
+                value = getattr(instance, field_name, None)
                 if value:
-                    localized = timezone.localtime(value, timezone.get_current_timezone())
-                    self.initial[field_name] = localized.strftime("%Y-%m-%dT%H:%M")
+                    self.initial[field_name] = timezone.localtime(value, self._tz).strftime(
+                        _LOCAL_FMT
+                    )
 
     def clean_target(self) -> str:
         target = (self.cleaned_data.get("target") or "").strip()
         if not target:
             raise forms.ValidationError("Укажите канал или чат для публикации")
-        normalized = target
-        if normalized.startswith(("http://", "https://")):
-            if "t.me/" in normalized:
-                normalized = normalized.split("t.me/", 1)[1]
-            normalized = normalized.strip("/")
-        if normalized.startswith("@"):
-            normalized = normalized.rstrip()
-        if normalized and not normalized.startswith("@") and not normalized.startswith("-"):
-            normalized = f"@{normalized}"
-        return normalized
-
-    def _clean_datetime(self, field: str):
-        value = self.cleaned_data.get(field)
-        if value is None:
+        return _normalize_tg_target(target)
+
+    def _to_local(self, value):
+        if not value:
             return None
-        current_tz = timezone.get_current_timezone()
         if timezone.is_naive(value):
-            value = timezone.make_aware(value, current_tz)
-        return value.astimezone(current_tz)
+            value = timezone.make_aware(value, self._tz)
+        return value.astimezone(self._tz)
 
     def clean_scheduled_for(self):
-        scheduled = self.cleaned_data.get("scheduled_for")
-        if not scheduled:
-            return None
-        return self._clean_datetime("scheduled_for")
+        return self._to_local(self.cleaned_data.get("scheduled_for"))
 
     def clean_published_at(self):
-        published = self.cleaned_data.get("published_at")
-        if not published:
-            return None
-        return self._clean_datetime("published_at")
+        return self._to_local(self.cleaned_data.get("published_at"))
 
     def clean(self):
         cleaned_data = super().clean()
+        scheduled_for = cleaned_data.get("scheduled_for")
+        created_at = self.instance.created_at
+        if scheduled_for and created_at and scheduled_for < created_at:
+            self.add_error(
+                "scheduled_for", "Время публикации не может быть раньше её создания"
+            )
         status = cleaned_data.get("status")
         if status == Publication.Status.PUBLISHED and not cleaned_data.get("published_at"):
             cleaned_data["published_at"] = timezone.now()
@@ -0,0 +1,84 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    replaces = [
+        ("stories", "0003_rewrite_presets"),
+        ("stories", "0004_story_image_file_story_image_prompt"),
+        ("stories", "0005_publication_media_order"),
+        ("stories", "0006_storyimage"),
+    ]
+
+    dependencies = [
+        ("projects", "0001_initial"),
+        ("stories", "0002_publication"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RewritePreset",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=100, verbose_name="Название")),
+                ("description", models.TextField(blank=True, verbose_name="Описание")),
+                ("style", models.CharField(blank=True, max_length=255, verbose_name="Стиль")),
+                ("editor_comment", models.TextField(blank=True, verbose_name="Комментарий редактора")),
+                ("max_length_tokens", models.PositiveIntegerField(default=1000, verbose_name="Максимальное количество токенов")),
+                ("output_format", models.JSONField(blank=True, default=dict, verbose_name="Формат вывода")),
+                ("is_active", models.BooleanField(default=True, verbose_name="Активен")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Создано")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="Обновлено")),
+                ("project", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="rewrite_presets", to="projects.project", verbose_name="Проект")),
+            ],
+            options={
+                "verbose_name": "Пресет рерайта",
+                "verbose_name_plural": "Пресеты рерайта",
+                "ordering": ("name",),
+                "unique_together": {("project", "name")},
+            },
+        ),
+        migrations.AddField(
+            model_name="rewritetask",
+            name="preset",
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="rewrite_tasks", to="stories.rewritepreset", verbose_name="Пресет"),
+        ),
+        migrations.AddField(
+            model_name="story",
+            name="last_rewrite_preset",
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="stories", to="stories.rewritepreset", verbose_name="Последний пресет"),
+        ),
+        migrations.AddField(
+            model_name="story",
+            name="image_file",
+            field=models.FileField(blank=True, null=True, upload_to="story_images/", verbose_name="Прикреплённое изображение"),
+        ),
+        migrations.AddField(
+            model_name="story",
+            name="image_prompt",
+            field=models.TextField(blank=True, default="", help_text="Последний промпт, по которому было сгенерировано изображение.", verbose_name="Описание изображения"),
+        ),
+        migrations.AddField(
+            model_name="publication",
+            name="media_order",
+            field=models.CharField(choices=[("before", "Перед текстом"), ("after", "После текста")], default="after", max_length=10, verbose_name="Порядок медиа"),
+        ),
+        migrations.CreateModel(
+            name="StoryImage",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("image_file", models.FileField(upload_to="story_images/", verbose_name="Изображение")),
+                ("prompt", models.TextField(blank=True, default="", verbose_name="Промпт генерации")),
+                ("source_kind", models.CharField(choices=[("generated", "Сгенерировано"), ("upload", "Загрузка"), ("source", "Источник")], default="generated", max_length=20, verbose_name="Источник")),
+                ("is_selected", models.BooleanField(default=True, verbose_name="Выбрано для публикации")),
+                ("is_main", models.BooleanField(default=False, verbose_name="Основное")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Создано")),
+                ("story", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="images", to="stories.story", verbose_name="Сюжет")),
+            ],
+            options={
+                "verbose_name": "Изображение сюжета",
+                "verbose_name_plural": "Изображения сюжетов",
+                "ordering": ("-is_main", "-created_at"),
+            },
+        ),
+    ]
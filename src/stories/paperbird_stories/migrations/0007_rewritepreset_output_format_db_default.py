@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0006_storyimage"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="rewritepreset",
+            name="output_format",
+            field=models.JSONField(
+                blank=True,
+                db_default={},
+                default=dict,
+                verbose_name="Формат вывода",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0007_rewritepreset_output_format_db_default"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="rewritepreset",
+            index=models.Index(
+                fields=["project", "is_active", "name"],
+                name="stories_rew_project_41c95c_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="storyimage",
+            index=models.Index(
+                fields=["story", "-is_main", "-created_at"],
+                name="stories_sto_story_i_09fe0b_idx",
+            ),
+        ),
+    ]
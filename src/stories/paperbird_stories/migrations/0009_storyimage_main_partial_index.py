@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0008_rewritepreset_storyimage_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="storyimage",
+            index=models.Index(
+                fields=["story", "-created_at"],
+                name="stories_sto_story_i_69c4b6_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="storyimage",
+            index=models.Index(
+                condition=models.Q(("is_main", True)),
+                fields=["story"],
+                name="stories_storyimage_main_idx",
+            ),
+        ),
+    ]
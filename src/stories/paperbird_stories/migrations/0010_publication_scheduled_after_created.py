@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+def clamp_backdated_schedules(apps, schema_editor):
+    Publication = apps.get_model("stories", "Publication")
+    Publication.objects.filter(scheduled_for__lt=models.F("created_at")).update(
+        scheduled_for=models.F("created_at")
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0009_storyimage_main_partial_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(clamp_backdated_schedules, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="publication",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("scheduled_for__isnull", True),
+                    ("scheduled_for__gte", models.F("created_at")),
+                    _connector="OR",
+                ),
+                name="publication_scheduled_after_created",
+                violation_error_message="Время публикации не может быть раньше её создания",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0010_publication_scheduled_after_created"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="publication",
+            index=models.Index(
+                fields=["status", "scheduled_for"],
+                name="stories_pub_status_00eaf2_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="publication",
+            index=models.Index(
+                condition=models.Q(("status", "scheduled")),
+                fields=["scheduled_for"],
+                name="stories_pub_scheduled_idx",
+            ),
+        ),
+    ]
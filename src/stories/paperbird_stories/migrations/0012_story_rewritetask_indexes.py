@@ -0,0 +1,46 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0011_publication_status_scheduled_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="rewritetask",
+            index=models.Index(
+                fields=["status", "-created_at"],
+                name="stories_rew_status_741814_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rewritetask",
+            index=models.Index(
+                fields=["story", "-created_at"],
+                name="stories_rew_story_i_89c6be_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rewritetask",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["created_at"],
+                name="stories_rwtask_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="story",
+            index=models.Index(
+                fields=["status", "-created_at"],
+                name="stories_sto_status_896d7c_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="story",
+            index=models.Index(
+                fields=["project", "-created_at"],
+                name="stories_sto_project_6274a4_idx",
+            ),
+        ),
+    ]
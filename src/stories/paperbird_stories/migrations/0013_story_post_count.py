@@ -0,0 +1,29 @@
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_post_count(apps, schema_editor):
+    Story = apps.get_model("stories", "Story")
+    stories = Story.objects.annotate(linked=Count("story_posts")).filter(linked__gt=0)
+    for story in stories.only("pk").iterator():
+        Story.objects.filter(pk=story.pk).update(post_count=story.linked)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0012_story_rewritetask_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="story",
+            name="post_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Денормализованное число привязанных постов для списков.",
+                verbose_name="Количество постов",
+            ),
+        ),
+        migrations.RunPython(fill_post_count, migrations.RunPython.noop),
+    ]
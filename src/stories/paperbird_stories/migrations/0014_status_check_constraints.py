@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0013_story_post_count"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="publication",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("status__in", ("scheduled", "publishing", "published", "failed"))
+                ),
+                name="publication_status_valid",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="rewritetask",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("status__in", ("pending", "running", "success", "failed"))),
+                name="rewritetask_status_valid",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="story",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("status__in", ("draft", "rewriting", "ready", "published"))),
+                name="story_status_valid",
+            ),
+        ),
+    ]
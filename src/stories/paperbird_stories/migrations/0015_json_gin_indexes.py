@@ -0,0 +1,25 @@
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0014_status_check_constraints"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="publication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["message_ids"],
+                name="stories_pub_message_ef5ca9_gin",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="story",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["hashtags"],
+                name="stories_sto_hashtag_350dba_gin",
+            ),
+        ),
+    ]
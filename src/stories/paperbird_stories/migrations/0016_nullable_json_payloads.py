@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+
+def clear_empty_payloads(apps, schema_editor):
+    Publication = apps.get_model("stories", "Publication")
+    Story = apps.get_model("stories", "Story")
+    Publication.objects.filter(raw_response={}).update(raw_response=None)
+    Story.objects.filter(last_rewrite_payload={}).update(last_rewrite_payload=None)
+
+
+def restore_empty_payloads(apps, schema_editor):
+    Publication = apps.get_model("stories", "Publication")
+    Story = apps.get_model("stories", "Story")
+    Publication.objects.filter(raw_response__isnull=True).update(raw_response={})
+    Story.objects.filter(last_rewrite_payload__isnull=True).update(last_rewrite_payload={})
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0015_json_gin_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="publication",
+            name="raw_response",
+            field=models.JSONField(blank=True, null=True, verbose_name="Ответ Telegram"),
+        ),
+        migrations.AlterField(
+            model_name="story",
+            name="last_rewrite_payload",
+            field=models.JSONField(
+                blank=True,
+                help_text="Сырые данные ответа модели (NULL, пока рерайта не было).",
+                null=True,
+                verbose_name="Результат рерайта",
+            ),
+        ),
+        migrations.RunPython(clear_empty_payloads, restore_empty_payloads),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0016_nullable_json_payloads"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="publication",
+            index=models.Index(
+                fields=["story", "-created_at"],
+                name="stories_pub_story_i_d3f299_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="storypost",
+            index=models.Index(
+                fields=["story", "position"],
+                name="stories_sto_story_i_1b7aa8_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+# Крупные JSON-ответы моделей и Telegram только пишутся и читаются целиком;
+# lz4 сжимает их в TOAST заметно быстрее стандартного pglz. Затрагивает только
+# новые значения; доступно с PostgreSQL 14, на других СУБД миграция ничего не делает.
+COMPRESSED_COLUMNS = (
+    ("stories_story", "prompt_snapshot"),
+    ("stories_story", "last_rewrite_payload"),
+    ("stories_rewritetask", "prompt_messages"),
+    ("stories_rewritetask", "result"),
+    ("stories_publication", "raw_response"),
+)
+
+
+def _set_compression(schema_editor, method: str) -> None:
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql" or connection.pg_version < 140000:
+        return
+    for table, column in COMPRESSED_COLUMNS:
+        schema_editor.execute(
+            f"ALTER TABLE {schema_editor.quote_name(table)} "
+            f"ALTER COLUMN {schema_editor.quote_name(column)} SET COMPRESSION {method}"
+        )
+
+
+def use_lz4(apps, schema_editor):
+    _set_compression(schema_editor, "lz4")
+
+
+def use_default(apps, schema_editor):
+    _set_compression(schema_editor, "default")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0017_storypost_publication_story_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(use_lz4, use_default),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0018_json_payload_lz4_compression"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="story",
+            name="publication_text",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Собранный текст публикации; обновляется при сохранении содержания.",
+                verbose_name="Текст публикации",
+            ),
+        ),
+    ]
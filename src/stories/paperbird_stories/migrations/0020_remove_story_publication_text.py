@@ -0,0 +1,14 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stories", "0019_story_publication_text"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="story",
+            name="publication_text",
+        ),
+    ]
@@ -4,17 +4,87 @@ from __future__ import annotations
 
 import json
 import mimetypes
-import uuid
-from collections.abc import Iterable
+import re
+import secrets
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from typing import IO, Any
 
-from django.core.files.base import ContentFile
-from django.db import models
-from django.utils import timezone
+from django.contrib.postgres.indexes import GinIndex
+from django.core.files.base import ContentFile, File
+from django.db import models, transaction
+from django.utils.functional import cached_property
 
+from core import clock
 from core.constants import REWRITE_DEFAULT_MAX_TOKENS
 from projects.models import Post, Project
 
+_HASHTAG_TRANSLATION = str.maketrans({" ": "_"})
+# Типы, которые реально приходят от генераторов и загрузок; остальное — через mimetypes.
+_IMAGE_EXTENSIONS = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/webp": "webp",
+    "image/gif": "gif",
+    "image/heic": "heic",
+    "image/avif": "avif",
+}
+
+
+def _update_row(
+    instance: models.Model,
+    *,
+    only_if: models.Q | None = None,
+    **values: Any,
+) -> int:
+    """Записывает поля одним UPDATE (без save() и сигналов) и отражает их на экземпляре.
+
+    Поля, вычисляемые в БД (``F()``, ``Now()``), становятся отложенными и
+    подгружаются при первом обращении, чтобы на экземпляре не осталось
+    устаревших значений. Условие ``only_if`` добавляется в WHERE; если строка
+    под него не попала, экземпляр не меняется. Возвращает число обновлённых строк.
+    """
+
+    values.setdefault("updated_at", clock.now())
+    queryset = type(instance)._default_manager.filter(pk=instance.pk)
+    if only_if is not None:
+        queryset = queryset.filter(only_if)
+    updated = queryset.update(**values)
+    if not updated:
+        return updated
+    for name, value in values.items():
+        if hasattr(value, "resolve_expression"):
+            instance.__dict__.pop(name, None)
+        else:
+            setattr(instance, name, value)
+    return updated
+
+
+class StoryQuerySet(models.QuerySet):
+    """Queryset сюжетов с заготовками для типовых выборок."""
+
+    def with_ordered_posts(self) -> StoryQuerySet:
+        """Подгружает посты сюжетов одним запросом в порядке `StoryPost.position`."""
+
+        return self.prefetch_related(
+            models.Prefetch(
+                "story_posts",
+                queryset=StoryPost.objects.select_related("post__source").order_by(
+                    "position", "id"
+                ),
+                to_attr="_ordered_story_posts",
+            )
+        )
+
+    def for_listing(self) -> StoryQuerySet:
+        """Откладывает загрузку JSON-полей рерайта, которые не нужны спискам."""
+
+        return self.defer("last_rewrite_payload", "prompt_snapshot")
+
 
 class Story(models.Model):
     """Сюжет, объединяющий несколько постов."""
@@ -55,9 +125,9 @@ class Story(models.Model):
     )
     last_rewrite_payload = models.JSONField(
         "Результат рерайта",
-        default=dict,
         blank=True,
-        help_text="Сырые данные ответа модели.",
+        null=True,
+        help_text="Сырые данные ответа модели (NULL, пока рерайта не было).",
     )
     image_prompt = models.TextField(
         "Описание изображения",
@@ -93,38 +163,117 @@ class Story(models.Model):
         related_name="stories",
         verbose_name="Посты",
     )
+    post_count = models.PositiveIntegerField(
+        "Количество постов",
+        default=0,
+        editable=False,
+        help_text="Денормализованное число привязанных постов для списков.",
+    )
+
+    objects = StoryQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Сюжет"
         verbose_name_plural = "Сюжеты"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=("status", "-created_at")),
+            models.Index(fields=("project", "-created_at")),
+            GinIndex(fields=("hashtags",)),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(status__in=("draft", "rewriting", "ready", "published")),
+                name="story_status_valid",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.title or f"Сюжет #{self.pk}"
 
-    # --- Работа с постами -------------------------------------------------
+    @cached_property
+    def active_rewrite_presets(self) -> models.QuerySet[RewritePreset]:
+        """Активные пресеты рерайта проекта сюжета, отсортированные по имени."""
 
-    def attach_posts(self, posts: Iterable[Post]) -> None:
-        """Привязывает посты к сюжету, сохраняя порядок передачи."""
+        return RewritePreset.objects.filter(
+            project_id=self.project_id,
+            is_active=True,
+        ).order_by("name")
 
-        StoryPost.objects.filter(story=self).delete()
-        story_posts = [
-            StoryPost(story=self, post=post, position=index)
-            for index, post in enumerate(posts)
-        ]
-        StoryPost.objects.bulk_create(story_posts)
+    # --- Работа с постами -------------------------------------------------
 
-    def ordered_posts(self) -> models.QuerySet[Post]:
-        """Возвращает queryset постов в порядке `StoryPost.position`."""
+    def attach_posts(self, posts: Iterable[Post], *, batch_size: int = 1000) -> None:
+        """Привязывает посты к сюжету, сохраняя порядок передачи.
+
+        Удаление лишних связей и upsert новых позиций выполняются в одной
+        транзакции; вставка идёт пачками по ``batch_size`` строк.
+        """
+
+        positions: dict[int, int] = {}
+        for post in posts:
+            positions.setdefault(post.pk, len(positions))
+        existing = dict(StoryPost.objects.filter(story=self).values_list("post_id", "position"))
+
+        stale = existing.keys() - positions.keys()
+        # Вставляем новые связи и обновляем позиции существующих upsert'ом,
+        # не трогая строки, которые уже стоят на своём месте. Объекты связей
+        # создаются лениво, так что в памяти одновременно не больше одной пачки.
+        changed = (
+            StoryPost(story=self, post_id=post_id, position=position)
+            for post_id, position in positions.items()
+            if existing.get(post_id) != position
+        )
+        batch = list(islice(changed, batch_size))
+        if not stale and not batch and self.post_count == len(positions):
+            return
 
-        return self.posts.order_by("story_posts__position", "story_posts__id")
+        with transaction.atomic():
+            if stale:
+                StoryPost.objects.filter(story=self, post_id__in=stale).delete()
+            while batch:
+                StoryPost.objects.bulk_create(
+                    batch,
+                    update_conflicts=True,
+                    unique_fields=["story", "post"],
+                    update_fields=["position"],
+                )
+                batch = list(islice(changed, batch_size))
+            if self.post_count != len(positions):
+                _update_row(self, post_count=len(positions))
+
+    def ordered_story_posts(self) -> Sequence[StoryPost]:
+        """Возвращает связи с постами в порядке `StoryPost.position` (с постами и источниками).
+
+        Если сюжет загружен через ``Story.objects.with_ordered_posts()``, берёт
+        связи из подгруженного списка без обращения к БД.
+        """
+
+        story_posts = getattr(self, "_ordered_story_posts", None)
+        if story_posts is not None:
+            return story_posts
+        return list(self.story_posts.select_related("post__source").order_by("position", "id"))
+
+    def ordered_posts(self) -> Sequence[Post]:
+        """Возвращает посты в порядке `StoryPost.position` (вместе с источниками).
+
+        Если сюжет загружен через ``Story.objects.with_ordered_posts()``, берёт
+        посты из подгруженного списка без обращения к БД.
+        """
+
+        story_posts = getattr(self, "_ordered_story_posts", None)
+        if story_posts is not None:
+            return [story_post.post for story_post in story_posts]
+        return self.posts.select_related("source").order_by(
+            "story_posts__position", "story_posts__id"
+        )
 
     # --- Обновление статуса и содержания ----------------------------------
 
     def mark_rewriting(self) -> None:
         """Отмечает сюжет как находящийся в процессе рерайта."""
-        self.status = self.Status.REWRITING
-        self.save(update_fields=["status", "updated_at"])
+        if self.status == self.Status.REWRITING:
+            return
+        _update_row(self, status=self.Status.REWRITING)
 
     def apply_rewrite(
         self,
@@ -136,58 +285,73 @@ class Story(models.Model):
         sources: list[str],
         payload: dict,
         preset: RewritePreset | None = None,
+        prompt_snapshot: list[dict[str, str]] | None = None,
     ) -> None:
-        """Применяет результаты рерайта к сюжету."""
-        self.title = title
-        self.summary = summary
-        self.body = body
-        self.hashtags = hashtags
-        self.sources = sources
-        self.status = self.Status.READY
-        self.last_rewrite_payload = payload
-        self.last_rewrite_at = timezone.now()
-        self.last_rewrite_preset = preset
-        self.save(
-            update_fields=[
-                "title",
-                "summary",
-                "body",
-                "hashtags",
-                "sources",
-                "status",
-                "last_rewrite_payload",
-                "last_rewrite_at",
-                "last_rewrite_preset",
-                "updated_at",
-            ]
-        )
+        """Применяет результаты рерайта к сюжету одним UPDATE."""
+        self.__dict__.pop("_publication_text_cache", None)
+        values: dict[str, Any] = {
+            "title": title,
+            "summary": summary,
+            "body": body,
+            "hashtags": hashtags,
+            "sources": sources,
+            "status": self.Status.READY,
+            "last_rewrite_payload": payload,
+            "last_rewrite_at": clock.now(),
+            "last_rewrite_preset": preset,
+        }
+        if prompt_snapshot is not None:
+            values["prompt_snapshot"] = prompt_snapshot
+        _update_row(self, **values)
+
+    def mark_draft(self) -> None:
+        """Возвращает сюжет в черновики (например, после неудачного рерайта)."""
+
+        _update_row(self, status=self.Status.DRAFT)
 
     def mark_published(self) -> None:
-        """Отмечает сюжет как опубликованный."""
+        """Отмечает сюжет как опубликованный (повторная отметка ничего не пишет)."""
 
-        self.status = self.Status.PUBLISHED
-        self.save(update_fields=["status", "updated_at"])
+        if self.status == self.Status.PUBLISHED:
+            return
+        _update_row(self, status=self.Status.PUBLISHED)
 
     def compose_publication_text(self) -> str:
-        """Собирает текст для публикации (заголовок, тело, хэштеги, источники)."""
+        """Собирает текст для публикации (заголовок, тело, хэштеги, источники).
 
-        parts: list[str] = []
-        title = (self.title or "").strip()
-        if title:
-            parts.append(title)
-        body = (self.body or "").strip()
-        if body:
-            parts.append(body)
-        if self.hashtags:
-            tags = " ".join(f"#{tag.lstrip('#').replace(' ', '_')}" for tag in self.hashtags if tag)
-            if tags:
-                parts.append(tags)
-        if self.sources:
-            sources_text = ", ".join(source for source in self.sources if source)
-            if sources_text:
-                parts.append(f"Источники: {sources_text}")
-        combined = "\n\n".join(part for part in parts if part)
-        return combined.strip()
+        Результат кэшируется на экземпляре и пересчитывается только при
+        изменении исходных полей.
+        """
+
+        key = (
+            self.title,
+            self.body,
+            tuple(self.hashtags or ()),
+            tuple(self.sources or ()),
+        )
+        cached = self.__dict__.get("_publication_text_cache")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = self._build_publication_text()
+        self.__dict__["_publication_text_cache"] = (key, text)
+        return text
+
+    def _build_publication_text(self) -> str:
+        tags = " ".join(
+            [
+                "#" + tag.lstrip("#").translate(_HASHTAG_TRANSLATION)
+                for tag in self.hashtags or ()
+                if tag
+            ]
+        )
+        sources = ", ".join([source for source in self.sources or () if source])
+        parts = (
+            (self.title or "").strip(),
+            (self.body or "").strip(),
+            tags,
+            f"Источники: {sources}" if sources else "",
+        )
+        return "\n\n".join([part for part in parts if part]).strip()
 
     # --- Работа с изображением ----------------------------------------------
 
@@ -221,7 +385,7 @@ class Story(models.Model):
         self,
         *,
         prompt: str,
-        data: bytes,
+        data: bytes | IO[bytes],
         mime_type: str,
         source_kind: str = "generated",
     ) -> StoryImage:
@@ -239,7 +403,7 @@ class Story(models.Model):
         self,
         *,
         prompt: str,
-        data: bytes,
+        data: bytes | IO[bytes],
         mime_type: str,
         source_kind: str,
         set_main: bool,
@@ -249,8 +413,8 @@ class Story(models.Model):
             raise ValueError("Пустые данные изображения")
 
         extension = self._extension_from_mime(mime_type)
-        filename = f"story_{self.pk}_{uuid.uuid4().hex}.{extension}"
-        content = ContentFile(data)
+        filename = f"story_{self.pk}_{secrets.token_hex(8)}.{extension}"
+        content = ContentFile(data) if isinstance(data, bytes) else File(data)
 
         image = StoryImage.objects.create(
             story=self,
@@ -294,6 +458,9 @@ class Story(models.Model):
         default_extension = "png"
         if not mime_type:
             return default_extension
+        known = _IMAGE_EXTENSIONS.get(mime_type.lower())
+        if known:
+            return known
         extension = mimetypes.guess_extension(mime_type) or ""
         extension = extension.lstrip(".")
         if extension:
@@ -340,6 +507,16 @@ class StoryImage(models.Model):
         verbose_name = "Изображение сюжета"
         verbose_name_plural = "Изображения сюжетов"
         ordering = ("-is_main", "-created_at")
+        indexes = [
+            models.Index(fields=("story", "-is_main", "-created_at")),
+            models.Index(fields=("story", "-created_at")),
+            # Главное изображение у сюжета одно: частичный индекс держит только его.
+            models.Index(
+                fields=("story",),
+                condition=models.Q(is_main=True),
+                name="stories_storyimage_main_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.story} — {self.image_file.name}"
@@ -369,6 +546,9 @@ class StoryPost(models.Model):
         verbose_name_plural = "Посты сюжетов"
         ordering = ("position", "id")
         unique_together = ("story", "post")
+        indexes = [
+            models.Index(fields=("story", "position")),
+        ]
 
     def __str__(self) -> str:
         return f"{self.story_id}->{self.post_id} ({self.position})"
@@ -383,6 +563,9 @@ class RewriteTask(models.Model):
         SUCCESS = "success", "Успех"
         FAILED = "failed", "Ошибка"
 
+    class AlreadyClaimed(RuntimeError):
+        """Задачу уже взял в работу другой исполнитель."""
+
     story = models.ForeignKey(
         Story,
         on_delete=models.CASCADE,
@@ -424,38 +607,73 @@ class RewriteTask(models.Model):
         verbose_name = "Задача рерайта"
         verbose_name_plural = "Задачи рерайта"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=("status", "-created_at")),
+            models.Index(fields=("story", "-created_at")),
+            models.Index(
+                fields=("created_at",),
+                condition=models.Q(status="pending"),
+                name="stories_rwtask_pending_idx",
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(status__in=("pending", "running", "success", "failed")),
+                name="rewritetask_status_valid",
+            ),
+        ]
 
     def mark_running(self) -> None:
-        """Отмечает задачу рерайта как запущенную."""
-        self.status = self.Status.RUNNING
-        self.attempts += 1
-        self.started_at = timezone.now()
-        self.save(update_fields=["status", "attempts", "started_at", "updated_at"])
+        """Захватывает задачу рерайта, если она ещё не выполняется.
+
+        Проверка статуса входит в тот же UPDATE, поэтому из конкурирующих
+        исполнителей задачу получает только один; остальные получают
+        :class:`AlreadyClaimed`. Проваленную задачу можно захватить повторно.
+        """
+        claimed = _update_row(
+            self,
+            only_if=models.Q(status__in=(self.Status.PENDING, self.Status.FAILED)),
+            status=self.Status.RUNNING,
+            attempts=models.F("attempts") + 1,
+            started_at=clock.now(),
+        )
+        if not claimed:
+            raise self.AlreadyClaimed(f"Задача рерайта #{self.pk} уже выполняется")
+
+    @contextmanager
+    def running(self) -> Iterator[RewriteTask]:
+        """Отмечает задачу запущенной, а при исключении внутри блока — проваленной."""
+
+        self.mark_running()
+        try:
+            yield self
+        except Exception as exc:
+            self.mark_failed(error=str(exc))
+            raise
 
     def mark_success(self, *, result: dict, response_id: str | None = None) -> None:
         """Отмечает задачу рерайта как успешно выполненную."""
-        self.status = self.Status.SUCCESS
-        self.result = result
-        self.response_id = response_id or ""
-        self.finished_at = timezone.now()
-        self.error_message = ""
-        self.save(
-            update_fields=[
-                "status",
-                "result",
-                "response_id",
-                "finished_at",
-                "error_message",
-                "updated_at",
-            ]
+        now = clock.now()
+        _update_row(
+            self,
+            status=self.Status.SUCCESS,
+            result=result,
+            response_id=response_id or "",
+            finished_at=now,
+            error_message="",
+            updated_at=now,
         )
 
     def mark_failed(self, *, error: str) -> None:
         """Отмечает задачу рерайта как проваленную."""
-        self.status = self.Status.FAILED
-        self.error_message = error
-        self.finished_at = timezone.now()
-        self.save(update_fields=["status", "error_message", "finished_at", "updated_at"])
+        now = clock.now()
+        _update_row(
+            self,
+            status=self.Status.FAILED,
+            error_message=error,
+            finished_at=now,
+            updated_at=now,
+        )
 
 
 @dataclass(slots=True)
@@ -471,65 +689,115 @@ class RewriteResult:
     @classmethod
     def from_dict(cls, data: dict) -> RewriteResult:
         """Создает объект RewriteResult из словаря."""
-        title = str(data.get("title", "")).strip()
+        raw_title = data.get("title", "")
+        title = (raw_title if isinstance(raw_title, str) else str(raw_title)).strip()
         raw_content = data.get("content")
         if raw_content is None and "text" in data:
             raw_content = data.get("text")
-        content = cls._coerce_content(raw_content)
+        # Типичный ответ модели — плоская строка: обходить её как дерево незачем.
+        if type(raw_content) is str:
+            content = raw_content.strip()
+        else:
+            content = cls._coerce_content(raw_content)
         if not content:
             raise ValueError("Ответ модели не содержит текста контента")
         return cls(title=title, content=content)
 
     @staticmethod
     def _coerce_content(value: object) -> str:
-        """Приводит контент к строковому виду."""
+        """Приводит контент к строковому виду.
+
+        Дерево ответа обходится явным стеком в том же порядке, что и
+        рекурсивный обход в глубину, но без кадра Python на каждый узел.
+        """
         texts: list[str] = []
         seen: set[str] = set()
+        direct_keys = ("text", "value")
+        container_keys = (
+            "paragraphs",
+            "chunks",
+            "children",
+            "items",
+            "nodes",
+            "sections",
+            "parts",
+            "content",
+        )
 
-        def add_text(text: str) -> None:
-            normalized = text.strip()
-            if normalized and normalized not in seen:
-                seen.add(normalized)
-                texts.append(normalized)
-
-        def collect(node: object) -> None:
+        stack: list[object] = [value]
+        while stack:
+            node = stack.pop()
             if not node:
-                return
-            if isinstance(node, str):
-                add_text(node)
-                return
+                continue
             if isinstance(node, list | tuple | set):
-                for item in node:
-                    collect(item)
-                return
+                stack.extend(reversed(list(node)))
+                continue
             if isinstance(node, dict):
-                direct_keys = ("text", "value")
-                for key in direct_keys:
-                    if key in node and isinstance(node[key], str):
-                        add_text(node[key])
-                container_keys = (
-                    "paragraphs",
-                    "chunks",
-                    "children",
-                    "items",
-                    "nodes",
-                    "sections",
-                    "parts",
-                    "content",
+                children: list[object] = [
+                    node[key] for key in direct_keys if isinstance(node.get(key), str)
+                ]
+                children.extend(node[key] for key in container_keys if key in node)
+                # Контейнерные ключи уже добавлены выше — повторный обход дал бы
+                # только дубликаты, которые всё равно отсеет `seen`.
+                children.extend(
+                    child
+                    for key, child in node.items()
+                    if key not in container_keys and isinstance(child, list | tuple | set | dict)
                 )
-                for key in container_keys:
-                    if key in node:
-                        collect(node[key])
-                for value in node.values():
-                    if isinstance(value, list | tuple | set | dict):
-                        collect(value)
-                return
-            add_text(str(node))
-
-        collect(value)
+                stack.extend(reversed(children))
+                continue
+            normalized = (node if isinstance(node, str) else str(node)).strip()
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                texts.append(normalized)
+
         return "\n\n".join(texts)
 
 
+def _coerce_message_ids(values: Iterable[Any]) -> list[int]:
+    """Приводит ID сообщений к int при записи, отбрасывая непригодные значения."""
+
+    result = []
+    for value in values or ():
+        try:
+            result.append(int(value))
+        except (TypeError, ValueError):
+            continue
+    return result
+
+
+# @name | http(s)://t.me/name (кроме инвайтов «+…») | tg://resolve?domain=name
+_TARGET_ALIAS_RE = re.compile(
+    r"@(.*)"
+    r"|https?://t\.me/+([^+/].*?)/*"
+    r"|tg://resolve\?domain=([^&]*)(?:&.*)?",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_target_alias(target: str) -> str | None:
+    """Извлекает alias канала из ``@name``, ссылки t.me или ``tg://resolve``.
+
+    Каналов у проекта немного, поэтому разбор кэшируется по строке цели.
+    """
+
+    # resolved_target() уже обрезал пробелы.
+    match = _TARGET_ALIAS_RE.fullmatch(target)
+    if match is None:
+        return None
+    return next(filter(None, match.groups()), None)
+
+
+class PublicationQuerySet(models.QuerySet):
+    """Queryset публикаций."""
+
+    def with_related(self) -> PublicationQuerySet:
+        """Подтягивает сюжет и проект, нужные `resolved_target()` и `message_url()`."""
+
+        return self.select_related("story__project")
+
+
 class Publication(models.Model):
     """Факт публикации сюжета."""
 
@@ -558,7 +826,7 @@ class Publication(models.Model):
     message_ids = models.JSONField("ID сообщений", default=list, blank=True)
     error_message = models.TextField("Ошибка", blank=True)
     attempts = models.PositiveIntegerField("Попытки", default=0)
-    raw_response = models.JSONField("Ответ Telegram", default=dict, blank=True)
+    raw_response = models.JSONField("Ответ Telegram", blank=True, null=True)
     media_order = models.CharField(
         "Порядок медиа",
         max_length=10,
@@ -568,16 +836,43 @@ class Publication(models.Model):
     created_at = models.DateTimeField("Создано", auto_now_add=True)
     updated_at = models.DateTimeField("Обновлено", auto_now=True)
 
+    objects = PublicationQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Публикация"
         verbose_name_plural = "Публикации"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=("status", "scheduled_for")),
+            models.Index(fields=("story", "-created_at")),
+            # Большинство публикаций уже в конечном статусе; планировщику нужны
+            # только запланированные.
+            models.Index(
+                fields=("scheduled_for",),
+                condition=models.Q(status="scheduled"),
+                name="stories_pub_scheduled_idx",
+            ),
+            GinIndex(fields=("message_ids",)),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(status__in=("scheduled", "publishing", "published", "failed")),
+                name="publication_status_valid",
+            ),
+            # Сравнение с now() в CHECK недопустимо (выражение должно быть
+            # неизменным), поэтому фиксируем эквивалент: время публикации не может
+            # предшествовать созданию записи.
+            models.CheckConstraint(
+                condition=models.Q(scheduled_for__isnull=True)
+                | models.Q(scheduled_for__gte=models.F("created_at")),
+                name="publication_scheduled_after_created",
+                violation_error_message="Время публикации не может быть раньше её создания",
+            ),
+        ]
 
     def mark_publishing(self) -> None:
         """Отмечает публикацию как находящуюся в процессе."""
-        self.status = self.Status.PUBLISHING
-        self.attempts += 1
-        self.save(update_fields=["status", "attempts", "updated_at"])
+        _update_row(self, status=self.Status.PUBLISHING, attempts=models.F("attempts") + 1)
 
     def mark_published(
         self,
@@ -587,28 +882,19 @@ class Publication(models.Model):
         raw: dict | None = None,
     ) -> None:
         """Отмечает публикацию как опубликованную."""
-        self.status = self.Status.PUBLISHED
-        self.message_ids = message_ids
-        self.published_at = published_at
-        self.error_message = ""
+        values: dict[str, Any] = {
+            "status": self.Status.PUBLISHED,
+            "message_ids": _coerce_message_ids(message_ids),
+            "published_at": published_at,
+            "error_message": "",
+        }
         if raw is not None:
-            self.raw_response = raw
-        self.save(
-            update_fields=[
-                "status",
-                "message_ids",
-                "published_at",
-                "error_message",
-                "raw_response",
-                "updated_at",
-            ]
-        )
+            values["raw_response"] = raw
+        _update_row(self, **values)
 
     def mark_failed(self, *, error: str) -> None:
         """Отмечает публикацию как проваленную."""
-        self.status = self.Status.FAILED
-        self.error_message = error
-        self.save(update_fields=["status", "error_message", "updated_at"])
+        _update_row(self, status=self.Status.FAILED, error_message=error)
 
     def resolved_target(self) -> str:
         """Возвращает целевой канал, учитывая настройки проекта."""
@@ -621,30 +907,16 @@ class Publication(models.Model):
     def _target_alias(self) -> str | None:
         """Приводит целевой канал к alias для формирования ссылки."""
 
-        target = self.resolved_target()
-        if not target:
-            return None
-        normalized = target.strip()
-        if normalized.startswith("@"):
-            alias = normalized[1:]
-            return alias or None
-        lowered = normalized.lower()
-        if lowered.startswith(("https://t.me/", "http://t.me/")):
-            start = lowered.index("t.me/") + len("t.me/")
-            alias = normalized[start:].strip("/")
-            if alias.startswith("+") or not alias:
-                return None
-            return alias
-        if lowered.startswith("tg://resolve?domain="):
-            alias = normalized.split("domain=", 1)[1]
-            alias = alias.split("&", 1)[0]
-            return alias or None
-        return None
+        return _parse_target_alias(self.resolved_target())
 
     def primary_message_id(self) -> int | None:
         """Возвращает первый ID сообщения из публикации."""
 
-        for value in self.message_ids or []:
+        message_ids = self.message_ids
+        if message_ids and type(message_ids[0]) is int:
+            return message_ids[0]
+        # Старые записи могли сохранить ID строками или с мусором.
+        for value in message_ids or []:
             try:
                 return int(value)
             except (TypeError, ValueError):
@@ -680,7 +952,7 @@ class RewritePreset(models.Model):
         "Максимальное количество токенов",
         default=REWRITE_DEFAULT_MAX_TOKENS,
     )
-    output_format = models.JSONField("Формат вывода", default=dict, blank=True)
+    output_format = models.JSONField("Формат вывода", default=dict, db_default={}, blank=True)
     is_active = models.BooleanField("Активен", default=True)
     created_at = models.DateTimeField("Создано", auto_now_add=True)
     updated_at = models.DateTimeField("Обновлено", auto_now=True)
@@ -690,10 +962,25 @@ class RewritePreset(models.Model):
         verbose_name_plural = "Пресеты рерайта"
         ordering = ("name",)
         unique_together = ("project", "name")
+        indexes = [
+            models.Index(fields=("project", "is_active", "name")),
+        ]
 
     def __str__(self) -> str:
         return f"{self.project.name}: {self.name}"
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        self.__dict__.pop("_output_format_json", None)
+        super().save(*args, **kwargs)
+
+    def refresh_from_db(self, *args: Any, **kwargs: Any) -> None:
+        self.__dict__.pop("_output_format_json", None)
+        super().refresh_from_db(*args, **kwargs)
+
+    @cached_property
+    def _output_format_json(self) -> str:
+        return json.dumps(self.output_format, ensure_ascii=False, indent=2)
+
     def instruction_block(self) -> str:
         """Формирует человекочитаемое описание настроек пресета."""
 
@@ -708,6 +995,5 @@ class RewritePreset(models.Model):
                 f"{self.max_length_tokens} токенов"
             )
         if self.output_format:
-            formatted = json.dumps(self.output_format, ensure_ascii=False, indent=2)
-            parts.append(f"Формат вывода:\n{formatted}")
+            parts.append(f"Формат вывода:\n{self._output_format_json}")
         return "\n".join(parts)
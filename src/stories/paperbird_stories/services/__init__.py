@@ -41,6 +41,7 @@ from .publisher import (
     default_publisher_for_story,
 )
 from .rewrite import (
+    CachedRewriteProvider,
     OpenAIChatProvider,
     ProviderResponse,
     RewriteProvider,
@@ -80,6 +81,7 @@ __all__ = [
     "StoryPublisher",
     "TelethonPublisherBackend",
     "default_publisher_for_story",
+    "CachedRewriteProvider",
     "OpenAIChatProvider",
     "ProviderResponse",
     "RewriteProvider",
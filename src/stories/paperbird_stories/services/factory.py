@@ -28,18 +28,16 @@ class StoryFactory:
         """Создает сюжет и прикрепляет к нему посты."""
         if not post_ids:
             raise StoryCreationError("Список постов пуст")
-        order_map = {post_id: index for index, post_id in enumerate(post_ids)}
-        posts = list(
-            Post.objects.filter(project=self.project, id__in=post_ids).order_by("id")
-        )
-        if len(order_map) != len(post_ids):
+        if len(set(post_ids)) != len(post_ids):
             raise StoryCreationError("Список постов содержит повторяющиеся значения")
-        if len(posts) != len(post_ids):
-            missing = set(post_ids) - {post.id for post in posts}
+        found = Post.objects.filter(project=self.project).in_bulk(post_ids)
+        if len(found) != len(post_ids):
+            missing = set(post_ids) - found.keys()
             raise StoryCreationError(
                 f"Посты не найдены или не принадлежат проекту: {sorted(missing)}"
             )
-        posts.sort(key=lambda post: order_map[post.id])
+        # Порядок задаёт вызывающий код, поэтому берём посты по словарю, без сортировки.
+        posts = [found[post_id] for post_id in post_ids]
         for post in posts:
             ensure_post_media_local(post)
 
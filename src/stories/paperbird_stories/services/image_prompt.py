@@ -82,7 +82,7 @@ def _build_replacements(story: Story) -> dict[str, str]:
 
 
 def _render_story_posts(story: Story) -> str:
-    posts = list(story.ordered_posts().select_related("source"))
+    posts = list(story.ordered_posts())
     if not posts:
         return "Источники не найдены."
     blocks: list[str] = []
@@ -6,6 +6,7 @@ import hashlib
 import struct
 import zlib
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass(slots=True)
@@ -26,21 +27,24 @@ def _png_chunk(tag: bytes, data: bytes) -> bytes:
     )
 
 
+_PLACEHOLDER_SIZE = 320
+_PNG_HEAD = b"\x89PNG\r\n\x1a\n" + _png_chunk(
+    b"IHDR",
+    struct.pack("!2I5B", _PLACEHOLDER_SIZE, _PLACEHOLDER_SIZE, 8, 6, 0, 0, 0),
+)
+_PNG_TAIL = _png_chunk(b"IEND", b"")
+
+
 def _placeholder_image_bytes(prompt: str) -> bytes:
     """Генерирует байты изображения-заглушки."""
-    width = height = 320
     digest = hashlib.sha256(prompt.encode("utf-8", "ignore")).digest()
-    color = digest[0], digest[8], digest[16]
-    pixel = bytes([color[0], color[1], color[2], 255])
-    rows = []
-    for _ in range(height):
-        rows.append(b"\x00" + pixel * width)
-    raw = b"".join(rows)
-    header = struct.pack("!2I5B", width, height, 8, 6, 0, 0, 0)
-    compressed = zlib.compress(raw, 9)
-    return (
-        b"\x89PNG\r\n\x1a\n"
-        + _png_chunk(b"IHDR", header)
-        + _png_chunk(b"IDAT", compressed)
-        + _png_chunk(b"IEND", b"")
-    )
+    return _placeholder_for_color(digest[0], digest[8], digest[16])
+
+
+@lru_cache(maxsize=256)
+def _placeholder_for_color(red: int, green: int, blue: int) -> bytes:
+    """Собирает однотонный PNG; меняется только цвет, поэтому результат кэшируется."""
+    row = b"\x00" + bytes((red, green, blue, 255)) * _PLACEHOLDER_SIZE
+    # Однотонные строки сжимаются одинаково хорошо и на первом уровне, а он заметно быстрее.
+    compressed = zlib.compress(row * _PLACEHOLDER_SIZE, 1)
+    return _PNG_HEAD + _png_chunk(b"IDAT", compressed) + _PNG_TAIL
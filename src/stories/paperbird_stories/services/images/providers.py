@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import base64
 import binascii
-import json
 import os
+import re
 import socket
 import time
 import urllib.error
 import urllib.request
 
+import httpx
 from django.conf import settings
 
+from core import json_fast
 from stories.paperbird_stories.services.helpers import (
     build_yandex_model_uri,
     normalize_image_quality,
@@ -25,6 +27,29 @@ from stories.paperbird_stories.services.images.placeholders import (
 
 from ..exceptions import ImageGenerationFailed
 
+# Base64 не содержит кавычек и escape-последовательностей, поэтому изображение
+# можно вырезать из тела ответа, не разбирая мегабайтный JSON целиком.
+_B64_JSON_RE = re.compile(rb'"b64_json"\s*:\s*"([^"\\]+)"')
+_MIME_TYPE_RE = re.compile(rb'"(?:mime_type|mimeType)"\s*:\s*"([^"\\]+)"')
+
+
+def _extract_b64_image(raw_body: bytes) -> GeneratedImage | None:
+    """Достаёт первое изображение ``b64_json`` из тела ответа OpenAI без разбора JSON.
+
+    Возвращает None, если быстрый путь неприменим и нужен полный разбор.
+    """
+
+    match = _B64_JSON_RE.search(raw_body)
+    if match is None:
+        return None
+    try:
+        decoded = base64.b64decode(match.group(1), validate=True)
+    except binascii.Error as exc:
+        raise ImageGenerationFailed("Некорректный ответ OpenAI") from exc
+    mime_match = _MIME_TYPE_RE.search(raw_body)
+    mime_type = mime_match.group(1).decode("ascii", "replace") if mime_match else "image/png"
+    return GeneratedImage(data=decoded, mime_type=mime_type)
+
 
 class ImageGenerationProvider:
     """Интерфейс генератора изображений."""
@@ -84,14 +109,14 @@ class OpenAIImageProvider:
             "size": normalize_image_size(size),
             "quality": use_quality,
         }
-        body = json.dumps(payload).encode("utf-8")
+        body = json_fast.dumps(payload)
         request = urllib.request.Request(self.api_url, data=body, method="POST")
         request.add_header("Content-Type", "application/json")
         request.add_header("Authorization", f"Bearer {api_key}")
 
         try:
             with urllib.request.urlopen(request, timeout=self.request_timeout) as response:
-                raw_body = response.read().decode("utf-8", "replace")
+                raw_body = response.read()
         except urllib.error.HTTPError as exc:  # pragma: no cover - требует живого API
             message = exc.read().decode("utf-8", "replace")
             raise ImageGenerationFailed(f"OpenAI HTTP {exc.code}: {message}") from exc
@@ -110,8 +135,11 @@ class OpenAIImageProvider:
         except OSError as exc:  # pragma: no cover
             raise ImageGenerationFailed(str(exc)) from exc
 
+        image = _extract_b64_image(raw_body)
+        if image is not None:
+            return image
         try:
-            data = json.loads(raw_body)
+            data = json_fast.loads(raw_body)
             content = data["data"][0]
             b64 = content.get("b64_json") or content.get("content")
             if not b64:
@@ -203,74 +231,79 @@ class YandexArtProvider:
                 "size": use_size,
             },
         }
-        body = json.dumps(request_body).encode("utf-8")
-        request = urllib.request.Request(
-            self.api_url,
-            data=body,
-            headers={
-                "Authorization": f"Api-Key {self.api_key}",
-                "Content-Type": "application/json",
-            },
-            method="POST",
-        )
+        # Один пул соединений на запуск и весь цикл опроса: TLS-рукопожатие
+        # выполняется один раз, а не на каждый запрос статуса.
+        with httpx.Client(
+            headers={"Authorization": f"Api-Key {self.api_key}"},
+            timeout=self.poll_timeout,
+        ) as client:
+            data = self._request_json(
+                client,
+                "POST",
+                self.api_url,
+                label="YandexART",
+                content=json_fast.dumps(request_body),
+                headers={"Content-Type": "application/json"},
+            )
+            operation_id = data.get("id")
+            if not operation_id:
+                raise ImageGenerationFailed("YandexART не вернул идентификатор операции")
+
+            deadline = time.time() + self.poll_timeout
+            status_url = f"{self.status_url}{operation_id}"
+            while time.time() < deadline:
+                status_data = self._request_json(
+                    client,
+                    "GET",
+                    status_url,
+                    label="YandexART status",
+                )
+                if status_data.get("done"):
+                    return self._image_from_operation(status_data)
+                time.sleep(self.poll_interval)
+
+        raise ImageGenerationFailed("YandexART не успел завершить генерацию")
+
+    @staticmethod
+    def _request_json(
+        client: httpx.Client,
+        method: str,
+        url: str,
+        *,
+        label: str,
+        **kwargs,
+    ) -> dict:
         try:
-            with urllib.request.urlopen(request, timeout=self.poll_timeout) as response:
-                data = json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as exc:  # pragma: no cover
-            message = exc.read().decode("utf-8", "replace")
-            raise ImageGenerationFailed(f"YandexART HTTP {exc.code}: {message}") from exc
-        except OSError as exc:  # pragma: no cover
+            response = client.request(method, url, **kwargs)
+        except httpx.HTTPError as exc:  # pragma: no cover - требует живого API
             raise ImageGenerationFailed(str(exc)) from exc
+        if response.status_code >= 400:  # pragma: no cover
+            raise ImageGenerationFailed(f"{label} HTTP {response.status_code}: {response.text}")
+        return json_fast.loads(response.content)
 
-        operation_id = data.get("id")
-        if not operation_id:
-            raise ImageGenerationFailed("YandexART не вернул идентификатор операции")
-
-        deadline = time.time() + self.poll_timeout
-        status_url = f"{self.status_url}{operation_id}"
-        while time.time() < deadline:
-            request = urllib.request.Request(
-                status_url,
-                headers={"Authorization": f"Api-Key {self.api_key}"},
-                method="GET",
+    @staticmethod
+    def _image_from_operation(status_data: dict) -> GeneratedImage:
+        response_data = status_data.get("response")
+        if not response_data:
+            error_details = status_data.get("error")
+            message = (
+                error_details.get("message")
+                if error_details
+                else "Неизвестная ошибка"
             )
-            try:
-                with urllib.request.urlopen(request, timeout=self.poll_timeout) as response:
-                    body = response.read().decode("utf-8")
-                    status_data = json.loads(body)
-            except urllib.error.HTTPError as exc:  # pragma: no cover
-                message = exc.read().decode("utf-8", "replace")
-                raise ImageGenerationFailed(f"YandexART status HTTP {exc.code}: {message}") from exc
-            except OSError as exc:  # pragma: no cover
-                raise ImageGenerationFailed(str(exc)) from exc
-
-            if status_data.get("done"):
-                response_data = status_data.get("response")
-                if not response_data:
-                    error_details = status_data.get("error")
-                    message = (
-                        error_details.get("message")
-                        if error_details
-                        else "Неизвестная ошибка"
-                    )
-                    raise ImageGenerationFailed(f"YandexART: {message}")
-
-                image_b64 = response_data.get("image")
-                if not image_b64:
-                    raise ImageGenerationFailed("YandexART не вернул изображение")
+            raise ImageGenerationFailed(f"YandexART: {message}")
 
-                try:
-                    image_bytes = base64.b64decode(image_b64, validate=True)
-                except (binascii.Error, ValueError) as exc:
-                    raise ImageGenerationFailed(
-                        "Некорректные данные изображения от YandexART"
-                    ) from exc
-                if not image_bytes:
-                    raise ImageGenerationFailed("Пустой ответ от YandexART")
-                return GeneratedImage(data=image_bytes, mime_type="image/png")
-            time.sleep(self.poll_interval)
+        image_b64 = response_data.get("image")
+        if not image_b64:
+            raise ImageGenerationFailed("YandexART не вернул изображение")
 
-        raise ImageGenerationFailed("YandexART не успел завершить генерацию")
+        try:
+            image_bytes = base64.b64decode(image_b64, validate=True)
+        except (binascii.Error, ValueError) as exc:
+            raise ImageGenerationFailed("Некорректные данные изображения от YandexART") from exc
+        if not image_bytes:
+            raise ImageGenerationFailed("Пустой ответ от YandexART")
+        return GeneratedImage(data=image_bytes, mime_type="image/png")
 
 
 class GeminiImageProvider:
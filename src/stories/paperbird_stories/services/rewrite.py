@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Protocol
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 
-from core.constants import OPENAI_DEFAULT_TEMPERATURE, OPENAI_RESPONSE_FORMAT, REWRITE_MAX_ATTEMPTS
+from core import json_fast
+from core.constants import (
+    OPENAI_DEFAULT_TEMPERATURE,
+    OPENAI_RESPONSE_FORMAT,
+    REWRITE_BATCH_CONCURRENCY,
+    REWRITE_MAX_ATTEMPTS,
+)
 from projects.models import Project
 from stories.paperbird_stories.models import RewritePreset, RewriteResult, RewriteTask, Story
 
@@ -50,6 +59,49 @@ class RewriteProvider(Protocol):
         ...
 
 
+@dataclass(slots=True)
+class CachedRewriteProvider:
+    """Кэширует ответы провайдера по хэшу модели, температуры и сообщений.
+
+    Повторный рерайт с тем же промптом не тратит запрос к модели. Ошибки не
+    кэшируются. Модель и температура берутся из атрибутов ``model``
+    (``model_name``) и ``temperature`` обёрнутого провайдера; при температуре
+    1.0 и выше (ответ недетерминирован) кэш не используется.
+    """
+
+    provider: RewriteProvider
+    ttl: int = 86400
+    key_prefix: str = "rewrite"
+
+    def run(self, *, messages: Sequence[dict[str, str]]) -> ProviderResponse:
+        model = getattr(self.provider, "model", None) or getattr(self.provider, "model_name", "")
+        temperature = getattr(self.provider, "temperature", None)
+        if temperature is not None and temperature >= 1.0:
+            return self.provider.run(messages=messages)
+        fingerprint = json.dumps(
+            {
+                "p": type(self.provider).__name__,
+                "m": model,
+                "t": temperature,
+                "msgs": list(messages),
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        digest = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+        key = f"{self.key_prefix}:{digest}"
+        cached = cache.get(key)
+        if cached is not None:
+            return ProviderResponse(**cached)
+        response = self.provider.run(messages=messages)
+        cache.set(
+            key,
+            {"result": response.result, "raw": response.raw, "response_id": response.response_id},
+            timeout=self.ttl,
+        )
+        return response
+
+
 @dataclass(slots=True)
 class StoryRewriter:
     """Отправляет сюжет на рерайт и применяет результат."""
@@ -66,6 +118,57 @@ class StoryRewriter:
         messages_override: Sequence[dict[str, str]] | None = None,
     ) -> RewriteTask:
         """Выполняет рерайт сюжета."""
+        task, messages = self._start(
+            story,
+            editor_comment=editor_comment,
+            preset=preset,
+            messages_override=messages_override,
+        )
+        return self._complete(story, task, messages, preset=preset)
+
+    def rewrite_many(
+        self,
+        stories: Iterable[Story],
+        *,
+        editor_comment: str | None = None,
+        preset: RewritePreset | None = None,
+        concurrency: int = REWRITE_BATCH_CONCURRENCY,
+    ) -> list[RewriteTask]:
+        """Переписывает несколько сюжетов, параллеля запросы к провайдеру.
+
+        В потоках выполняются только первые вызовы ``provider.run``; запись в БД
+        и повторные попытки идут в текущем потоке. Ошибка одного сюжета не
+        прерывает остальные: его задача остаётся в статусе FAILED, а уже
+        захваченная другим исполнителем задача пропускается.
+        """
+
+        jobs = [
+            (story, *self._start(story, editor_comment=editor_comment, preset=preset))
+            for story in stories
+        ]
+        if not jobs:
+            return []
+        tasks: list[RewriteTask] = []
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(jobs)))) as pool:
+            calls = [pool.submit(self.provider.run, messages=messages) for _, _, messages in jobs]
+            for (story, task, messages), call in zip(jobs, calls, strict=True):
+                try:
+                    self._complete(story, task, messages, preset=preset, first_call=call)
+                except RewriteFailed as exc:
+                    logger.warning("Rewrite of story %s failed: %s", story.pk, exc)
+                except RewriteTask.AlreadyClaimed as exc:
+                    logger.warning("Rewrite of story %s skipped: %s", story.pk, exc)
+                tasks.append(task)
+        return tasks
+
+    def _start(
+        self,
+        story: Story,
+        *,
+        editor_comment: str | None,
+        preset: RewritePreset | None,
+        messages_override: Sequence[dict[str, str]] | None = None,
+    ) -> tuple[RewriteTask, list[dict[str, str]]]:
         messages, user_comment = make_prompt_messages(
             story,
             editor_comment=editor_comment,
@@ -88,44 +191,56 @@ class StoryRewriter:
                 editor_comment=story.editor_comment,
                 preset=preset,
             )
+        return task, messages
 
+    def _complete(
+        self,
+        story: Story,
+        task: RewriteTask,
+        messages: list[dict[str, str]],
+        *,
+        preset: RewritePreset | None,
+        first_call: Future[ProviderResponse] | None = None,
+    ) -> RewriteTask:
         last_error = ""
         for attempt in range(1, self.max_attempts + 1):
             try:
-                task.mark_running()
-                provider_response = self.provider.run(messages=messages)
-                result = RewriteResult.from_dict(provider_response.result)
-                payload = {
-                    "structured": {
-                        "title": result.title,
-                        "text": result.content,
-                    },
-                    "raw": provider_response.raw,
-                }
-                if provider_response.result != payload["structured"]:
-                    payload["provider_result"] = provider_response.result
-                task.mark_success(
-                    result=provider_response.result,
-                    response_id=provider_response.response_id,
-                )
-                story.apply_rewrite(
-                    title=result.title or story.title,
-                    summary=result.summary,
-                    body=result.content,
-                    hashtags=result.hashtags,
-                    sources=result.sources,
-                    payload=payload,
-                    preset=preset,
-                )
-                story.prompt_snapshot = messages
-                story.save(update_fields=["prompt_snapshot", "updated_at"])
+                with task.running():
+                    if first_call is not None:
+                        provider_response, first_call = first_call.result(), None
+                    else:
+                        provider_response = self.provider.run(messages=messages)
+                    result = RewriteResult.from_dict(provider_response.result)
+                    payload = {
+                        "structured": {
+                            "title": result.title,
+                            "text": result.content,
+                        },
+                        "raw": provider_response.raw,
+                    }
+                    if provider_response.result != payload["structured"]:
+                        payload["provider_result"] = provider_response.result
+                    task.mark_success(
+                        result=provider_response.result,
+                        response_id=provider_response.response_id,
+                    )
+                    story.apply_rewrite(
+                        title=result.title or story.title,
+                        summary=result.summary,
+                        body=result.content,
+                        hashtags=result.hashtags,
+                        sources=result.sources,
+                        payload=payload,
+                        preset=preset,
+                        prompt_snapshot=messages,
+                    )
                 return task
+            except RewriteTask.AlreadyClaimed:
+                raise
             except Exception as exc:  # pragma: no cover - защитный слой, проверяется в тестах
                 last_error = str(exc)
-                task.mark_failed(error=last_error)
                 if attempt >= self.max_attempts:
-                    story.status = Story.Status.DRAFT
-                    story.save(update_fields=["status", "updated_at"])
+                    story.mark_draft()
                     raise RewriteFailed(last_error) from exc
         raise RewriteFailed(last_error)
 
@@ -155,6 +270,7 @@ class OpenAIChatProvider:
                 normalized_model,
             )
         self.model = normalized_model
+        self.temperature = _openai_temperature_for_model(self.model)
         self.timeout = timeout or getattr(settings, "OPENAI_TIMEOUT", 30)
         if not self.api_key:
             raise RewriteFailed("OPENAI_API_KEY не задан")
@@ -164,14 +280,13 @@ class OpenAIChatProvider:
         import urllib.error
         import urllib.request
 
-        temperature = _openai_temperature_for_model(self.model)
         payload_dict = {
             "model": self.model,
             "messages": list(messages),
-            "temperature": temperature,
+            "temperature": self.temperature,
             "response_format": OPENAI_RESPONSE_FORMAT.copy(),
         }
-        payload = json.dumps(payload_dict).encode("utf-8")
+        payload = json_fast.dumps(payload_dict)
         request = urllib.request.Request(
             self.api_url,
             data=payload,
@@ -183,7 +298,7 @@ class OpenAIChatProvider:
         )
         try:
             with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                data = json.loads(response.read().decode("utf-8"))
+                data = json_fast.loads(response.read())
         except urllib.error.HTTPError as exc:  # pragma: no cover - требует живого API
             message = exc.read().decode("utf-8", "replace")
             raise RewriteFailed(f"OpenAI HTTP {exc.code}: {message}") from exc
@@ -256,6 +371,7 @@ class YandexGPTProvider:
             getattr(settings, "OPENAI_TIMEOUT", 30),
         )
         self.model = (model or "yandexgpt-lite").strip()
+        self.temperature = OPENAI_DEFAULT_TEMPERATURE
         if not self.api_key:
             raise RewriteFailed("YANDEX_API_KEY не задан")
         if self.model.startswith("gpt://"):
@@ -283,12 +399,12 @@ class YandexGPTProvider:
             "modelUri": self.model_uri,
             "completionOptions": {
                 "stream": False,
-                "temperature": OPENAI_DEFAULT_TEMPERATURE,
+                "temperature": self.temperature,
                 "maxTokens": "2000",
             },
             "messages": yc_messages,
         }
-        body = json.dumps(payload).encode("utf-8")
+        body = json_fast.dumps(payload)
         request = urllib.request.Request(
             self.api_url,
             data=body,
@@ -300,7 +416,7 @@ class YandexGPTProvider:
         )
         try:
             with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                data = json.loads(response.read().decode("utf-8"))
+                data = json_fast.loads(response.read())
         except urllib.error.HTTPError as exc:  # pragma: no cover - требует живого API
             message = exc.read().decode("utf-8", "replace")
             raise RewriteFailed(f"YandexGPT HTTP {exc.code}: {message}") from exc
@@ -409,4 +525,7 @@ def default_rewriter(*, project: Project | None = None) -> StoryRewriter:
         provider = GeminiChatProvider(**provider_kwargs)
     else:
         provider = OpenAIChatProvider(**provider_kwargs)
+    cache_ttl = getattr(settings, "REWRITE_CACHE_TTL", 0)
+    if cache_ttl > 0:
+        provider = CachedRewriteProvider(provider=provider, ttl=cache_ttl)
     return StoryRewriter(provider=provider)
@@ -10,10 +10,12 @@ from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 from django.utils import timezone
 
 from projects.models import Post, Project, Source
+from stories.paperbird_stories.models import Story
 from stories.paperbird_stories.services import StoryCreationError, StoryFactory
 
 User = get_user_model()
@@ -48,6 +50,82 @@ class StoryFactoryTests(TestCase):
         self.assertEqual([self.post_b.id, self.post_a.id], ordered_ids)
         self.assertEqual(story.title, "Draft")
 
+    def test_attach_posts_reorders_and_drops_stale_links(self) -> None:
+        post_c = Post.objects.create(
+            project=self.project,
+            source=self.source,
+            telegram_id=3,
+            message="Третий пост",
+            posted_at=timezone.now(),
+        )
+        story = StoryFactory(project=self.project).create(post_ids=[self.post_a.id, self.post_b.id])
+        kept_link = story.story_posts.get(post=self.post_a)
+
+        story.attach_posts([post_c, self.post_a])
+
+        ordered_ids = list(story.ordered_posts().values_list("id", flat=True))
+        self.assertEqual([post_c.id, self.post_a.id], ordered_ids)
+        self.assertTrue(story.story_posts.filter(pk=kept_link.pk, position=1).exists())
+
+    def test_attach_posts_keeps_post_count_in_sync(self) -> None:
+        story = StoryFactory(project=self.project).create(post_ids=[self.post_a.id, self.post_b.id])
+        self.assertEqual(story.post_count, 2)
+
+        story.attach_posts([self.post_b])
+
+        self.assertEqual(story.post_count, 1)
+        story.refresh_from_db()
+        self.assertEqual(story.post_count, 1)
+
+    def test_attach_posts_upserts_in_batches(self) -> None:
+        story = StoryFactory(project=self.project).create(post_ids=[self.post_a.id])
+
+        story.attach_posts([self.post_b, self.post_a], batch_size=1)
+
+        self.assertEqual(
+            [(self.post_b.id, 0), (self.post_a.id, 1)],
+            list(story.story_posts.order_by("position").values_list("post_id", "position")),
+        )
+        self.assertEqual(story.post_count, 2)
+
+    def test_attach_posts_skips_writes_when_unchanged(self) -> None:
+        story = StoryFactory(project=self.project).create(post_ids=[self.post_a.id, self.post_b.id])
+        with self.assertNumQueries(1):
+            story.attach_posts([self.post_a, self.post_b])
+
+    def test_with_ordered_posts_serves_posts_from_prefetch(self) -> None:
+        created = StoryFactory(project=self.project).create(
+            post_ids=[self.post_b.id, self.post_a.id]
+        )
+        story = Story.objects.with_ordered_posts().get(pk=created.pk)
+        with self.assertNumQueries(0):
+            posts = story.ordered_posts()
+            self.assertEqual([self.post_b.id, self.post_a.id], [post.id for post in posts])
+            self.assertEqual(posts[0].source, self.source)
+
+    def test_ordered_story_posts_reuses_prefetch(self) -> None:
+        created = StoryFactory(project=self.project).create(
+            post_ids=[self.post_b.id, self.post_a.id]
+        )
+        story = Story.objects.with_ordered_posts().get(pk=created.pk)
+        with self.assertNumQueries(0):
+            story_posts = story.ordered_story_posts()
+            self.assertEqual(
+                [self.post_b.id, self.post_a.id],
+                [story_post.post.id for story_post in story_posts],
+            )
+
+    def test_status_constraint_rejects_unknown_value(self) -> None:
+        story = StoryFactory(project=self.project).create(post_ids=[self.post_a.id])
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Story.objects.filter(pk=story.pk).update(status="archived")
+
+    def test_factory_rejects_duplicates_before_querying(self) -> None:
+        factory = StoryFactory(project=self.project)
+        with self.assertNumQueries(0), self.assertRaises(StoryCreationError):
+            factory.create(post_ids=[self.post_a.id, self.post_a.id])
+
     def test_factory_rejects_foreign_posts(self) -> None:
         other_project = Project.objects.create(owner=self.user, name="Other")
         other_source = Source.objects.create(project=other_project, telegram_id=2000)
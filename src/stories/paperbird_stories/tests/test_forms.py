@@ -11,8 +11,11 @@ from django.utils import timezone
 
 from projects.models import Project
 from stories.paperbird_stories.forms import (
+    ACTIVE_PRESETS_PREFETCH,
+    StoryContentForm,
     StoryImageAttachForm,
     StoryImageGenerateForm,
+    StoryPromptConfirmForm,
     StoryPublishForm,
     StoryRewriteForm,
 )
@@ -47,6 +50,69 @@ class StoryRewriteFormTests(TestCase):
         self.assertCountEqual(preset_names, ["Пресет А", "Пресет Б"])
         self.assertEqual(form.fields["preset"].initial, self.preset_b)
 
+    def test_presets_loaded_in_single_narrow_query(self) -> None:
+        with self.assertNumQueries(1) as ctx:
+            StoryRewriteForm(story=self.story)
+        self.assertNotIn("editor_comment", ctx.captured_queries[0]["sql"])
+
+    def test_prefetched_presets_skip_form_query(self) -> None:
+        story = (
+            Story.objects.select_related("project", "last_rewrite_preset")
+            .prefetch_related(ACTIVE_PRESETS_PREFETCH)
+            .get(pk=self.story.pk)
+        )
+        with self.assertNumQueries(0):
+            form = StoryRewriteForm(story=story)
+            html = str(form["preset"])
+        self.assertIn("Пресет Б", html)
+
+    def test_widget_renders_from_cached_presets(self) -> None:
+        form = StoryRewriteForm(story=self.story)
+        with self.assertNumQueries(0):
+            html = str(form["preset"])
+        self.assertIn("Пресет А", html)
+        self.assertIn(f'value="{self.preset_b.pk}" selected', html)
+
+    def test_form_without_story_offers_no_presets(self) -> None:
+        form = StoryRewriteForm()
+        self.assertFalse(form.fields["preset"].queryset.exists())
+        self.assertIsNone(StoryPromptConfirmForm({"preset": "1"}).selected_preset)
+
+    def test_prompt_form_resolves_selected_preset_without_queries(self) -> None:
+        form = StoryPromptConfirmForm(
+            {"preset": str(self.preset_a.pk), "prompt_system": "", "prompt_user": ""},
+            story=self.story,
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(form.selected_preset, self.preset_a)
+        inactive = StoryPromptConfirmForm({"preset": "999999"}, story=self.story)
+        with self.assertNumQueries(0):
+            self.assertIsNone(inactive.selected_preset)
+
+
+class StoryContentFormTests(TestCase):
+    def setUp(self) -> None:
+        user = User.objects.create_user("writer", password="pass")
+        project = Project.objects.create(owner=user, name="Контент")
+        self.story = Story.objects.create(project=project, title="Старый", body="Текст")
+
+    def test_save_updates_only_changed_columns(self) -> None:
+        form = StoryContentForm({"title": "Новый", "body": "Текст"}, instance=self.story)
+        self.assertTrue(form.is_valid())
+        with self.assertNumQueries(1) as ctx:
+            form.save()
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertIn('"title"', sql)
+        self.assertNotIn('"body"', sql)
+        self.story.refresh_from_db()
+        self.assertEqual(self.story.title, "Новый")
+
+    def test_save_without_changes_skips_update(self) -> None:
+        form = StoryContentForm({"title": "Старый", "body": "Текст"}, instance=self.story)
+        self.assertTrue(form.is_valid())
+        with self.assertNumQueries(0):
+            form.save()
+
 
 class StoryPublishFormTests(TestCase):
     def test_accepts_future_datetime(self) -> None:
@@ -82,6 +148,18 @@ class StoryPublishFormTests(TestCase):
         self.assertTrue(form.is_valid())
         self.assertEqual(form.cleaned_data["target"], "@example")
 
+    def test_normalizes_bare_and_slashed_targets(self) -> None:
+        cases = {
+            "t.me/example/": "@example",
+            "HTTPS://T.ME/example": "@example",
+            "@example": "@example",
+            "-1001234": "-1001234",
+        }
+        for raw, expected in cases.items():
+            form = StoryPublishForm(data={"target": raw})
+            self.assertTrue(form.is_valid(), raw)
+            self.assertEqual(form.cleaned_data["target"], expected)
+
     def test_requires_target(self) -> None:
         form = StoryPublishForm(data={"target": "   "})
         self.assertFalse(form.is_valid())
@@ -104,4 +182,48 @@ class StoryImageFormsTests(TestCase):
             }
         )
         self.assertTrue(form.is_valid())
-        self.assertEqual(form.cleaned_data["image_data"], b"binary")
+        self.assertEqual(form.cleaned_data["image_data"].read(), b"binary")
+
+    def test_attach_form_trims_surrounding_whitespace(self) -> None:
+        encoded = base64.b64encode(b"binary").decode("ascii")
+        form = StoryImageAttachForm(
+            data={"prompt": "Sunset", "image_data": f"  {encoded}\n", "mime_type": "image/png"}
+        )
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["image_data"].read(), b"binary")
+
+    def test_attach_form_rejects_invalid_payload(self) -> None:
+        form = StoryImageAttachForm(
+            data={
+                "prompt": "Sunset",
+                "image_data": "not base64!",
+                "mime_type": "image/png",
+            }
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("image_data", form.errors)
+
+    def test_attach_form_checks_hidden_choices(self) -> None:
+        encoded = base64.b64encode(b"binary").decode("ascii")
+        data = {"prompt": "Sunset", "image_data": encoded, "mime_type": "image/png"}
+        self.assertTrue(StoryImageAttachForm(data={**data, "model": "dall-e-3"}).is_valid())
+        form = StoryImageAttachForm(data={**data, "model": "unknown"})
+        self.assertFalse(form.is_valid())
+        self.assertIn("model", form.errors)
+
+    def test_attach_form_rejects_malformed_mime_type(self) -> None:
+        encoded = base64.b64encode(b"binary").decode("ascii")
+        for mime_type in ("image/", "image/<script>", "image/../evil", "text/plain"):
+            form = StoryImageAttachForm(
+                data={"prompt": "Sunset", "image_data": encoded, "mime_type": mime_type}
+            )
+            self.assertFalse(form.is_valid(), mime_type)
+            self.assertIn("mime_type", form.errors)
+
+    def test_attach_form_accepts_mime_types_known_to_model(self) -> None:
+        encoded = base64.b64encode(b"binary").decode("ascii")
+        for mime_type in ("image/heic", "image/avif", "image/webp"):
+            form = StoryImageAttachForm(
+                data={"prompt": "Sunset", "image_data": encoded, "mime_type": mime_type}
+            )
+            self.assertTrue(form.is_valid(), form.errors)
@@ -9,9 +9,11 @@ import os
 from unittest.mock import patch
 from urllib.error import HTTPError
 
+import httpx
 from django.test import SimpleTestCase
 
-from stories.paperbird_stories.services import OpenAIImageProvider
+from stories.paperbird_stories.services import OpenAIImageProvider, YandexArtProvider
+from stories.paperbird_stories.services.images import _placeholder_image_bytes
 
 
 class OpenAIImageProviderTests(SimpleTestCase):
@@ -151,3 +153,72 @@ class OpenAIImageProviderTests(SimpleTestCase):
 
         self.assertEqual(payloads[0]["quality"], "low")
         self.assertEqual(payloads[1]["quality"], "high")
+
+    def test_extracts_image_without_parsing_json(self) -> None:
+        provider = OpenAIImageProvider()
+        body = json.dumps(
+            {
+                "created": 1,
+                "data": [
+                    {
+                        "b64_json": base64.b64encode(b"webp-bytes").decode("ascii"),
+                        "mime_type": "image/webp",
+                    }
+                ],
+            }
+        ).encode("utf-8")
+
+        with (
+            patch("urllib.request.urlopen", return_value=io.BytesIO(body)),
+            patch("stories.paperbird_stories.services.images.providers.json_fast.loads") as loads,
+        ):
+            image = provider.generate(prompt="Demo")
+
+        loads.assert_not_called()
+        self.assertEqual(image.data, b"webp-bytes")
+        self.assertEqual(image.mime_type, "image/webp")
+
+
+class YandexArtProviderTests(SimpleTestCase):
+    def test_polls_operation_over_one_client(self) -> None:
+        provider = YandexArtProvider(api_key="key", folder_id="folder")
+        statuses = iter([{"done": False}, {"done": True, "response": {"image": "cG5n"}}])
+        requests: list[tuple[str, str]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append((request.method, request.headers["Authorization"]))
+            if request.method == "POST":
+                return httpx.Response(200, json={"id": "op-1"})
+            return httpx.Response(200, json=next(statuses))
+
+        real_client = httpx.Client
+        clients: list[httpx.Client] = []
+
+        def make_client(**kwargs):
+            client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+            clients.append(client)
+            return client
+
+        module = "stories.paperbird_stories.services.images.providers"
+        with (
+            patch(f"{module}.httpx.Client", side_effect=make_client),
+            patch(f"{module}.time.sleep"),
+        ):
+            image = provider.generate(prompt="Кот")
+
+        self.assertEqual(image.data, b"png")
+        self.assertEqual(len(clients), 1)
+        self.assertEqual(
+            requests,
+            [("POST", "Api-Key key"), ("GET", "Api-Key key"), ("GET", "Api-Key key")],
+        )
+
+
+class PlaceholderImageTests(SimpleTestCase):
+    def test_placeholder_is_valid_png_and_cached_per_color(self) -> None:
+        first = _placeholder_image_bytes("Кот на крыше")
+
+        self.assertTrue(first.startswith(b"\x89PNG\r\n\x1a\n"))
+        self.assertTrue(first.endswith(b"IEND\xaeB`\x82"))
+        self.assertIs(_placeholder_image_bytes("Кот на крыше"), first)
+        self.assertNotEqual(_placeholder_image_bytes("Собака"), first)
@@ -34,6 +34,12 @@ class StoryImageViewTests(TestCase):
             summary="Закат над морем",
         )
 
+    def test_extension_from_mime(self) -> None:
+        self.assertEqual(Story._extension_from_mime("image/JPEG"), "jpg")
+        self.assertEqual(Story._extension_from_mime("image/webp"), "webp")
+        self.assertEqual(Story._extension_from_mime("image/bmp"), "bmp")
+        self.assertEqual(Story._extension_from_mime(""), "png")
+
     def test_get_renders_form(self) -> None:
         response = self.client.get(reverse("stories:image", kwargs={"pk": self.story.pk}))
         self.assertEqual(response.status_code, HTTPStatus.OK)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -59,12 +61,36 @@ class PublicPagesTests(TestCase):
         self.assertNotContains(response, "Запланированный текст")
         self.assertNotContains(response, "Чужой сюжет")
 
+    def test_public_project_list_queries_do_not_grow_with_publications(self) -> None:
+        url = reverse("public:project", args=[self.project.id])
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(url)
+        for index in range(3):
+            story = Story.objects.create(project=self.project, title=f"Ещё сюжет {index}")
+            Publication.objects.create(
+                story=story,
+                target="@public",
+                status=Publication.Status.PUBLISHED,
+                result_text="Текст",
+                published_at=timezone.now(),
+            )
+
+        with self.assertNumQueries(len(single.captured_queries)):
+            self.client.get(url)
+
     def test_publication_detail(self) -> None:
         url = reverse("public:publication", args=[self.project.id, self.published.id])
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Опубликованный текст")
 
+    def test_publication_detail_skips_raw_payloads(self) -> None:
+        url = reverse("public:publication", args=[self.project.id, self.published.id])
+        response = self.client.get(url)
+        publication = response.context["publication"]
+        self.assertIn("raw_response", publication.get_deferred_fields())
+        self.assertIn("last_rewrite_payload", publication.story.get_deferred_fields())
+
     def test_publication_detail_requires_published_status(self) -> None:
         scheduled = Publication.objects.filter(status=Publication.Status.SCHEDULED).first()
         url = reverse("public:publication", args=[self.project.id, scheduled.id])
@@ -6,6 +6,7 @@ from datetime import timedelta
 from http import HTTPStatus
 
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
@@ -120,6 +121,34 @@ class PublicationListManageTests(TestCase):
         self.assertGreaterEqual(self.publication.published_at, before)
         self.assertLessEqual(self.publication.published_at, after + timedelta(seconds=5))
 
+    def test_rejects_schedule_before_creation(self) -> None:
+        prefix = self._prefix()
+        backdated = timezone.localtime(self.publication.created_at - timedelta(days=1))
+        data = self._base_post_data()
+        data.update(
+            {
+                "submit_action": "save",
+                f"{prefix}-status": Publication.Status.SCHEDULED,
+                f"{prefix}-target": "@fallback",
+                f"{prefix}-scheduled_for": backdated.strftime("%Y-%m-%dT%H:%M"),
+                f"{prefix}-published_at": "",
+                f"{prefix}-result_text": "Исходный текст",
+                f"{prefix}-error_message": "",
+            }
+        )
+
+        response = self.client.post(reverse("stories:publications"), data=data)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.publication.refresh_from_db()
+        self.assertGreater(self.publication.scheduled_for, self.publication.created_at)
+
+    def test_database_rejects_backdated_schedule(self) -> None:
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Publication.objects.filter(pk=self.publication.pk).update(
+                scheduled_for=self.publication.created_at - timedelta(minutes=1)
+            )
+
     def test_delete_publication_removes_record(self) -> None:
         prefix = self._prefix()
         data = self._base_post_data()
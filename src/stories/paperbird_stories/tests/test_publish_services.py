@@ -57,6 +57,82 @@ class StoryPublisherTests(TestCase):
         self.assertIn("#новости", text)
         self.assertIn("Источники", text)
 
+    def test_compose_publication_text_is_cached_until_fields_change(self) -> None:
+        first = self.story.compose_publication_text()
+        with patch.object(Story, "_build_publication_text") as build:
+            self.assertEqual(self.story.compose_publication_text(), first)
+        build.assert_not_called()
+
+        self.story.body = "Исправленный текст"
+        self.assertIn("Исправленный текст", self.story.compose_publication_text())
+
+    def test_mark_publishing_increments_attempts_atomically(self) -> None:
+        publication = Publication.objects.create(story=self.story, target="@channel")
+        stale = Publication.objects.get(pk=publication.pk)
+
+        with self.assertNumQueries(1):
+            publication.mark_publishing()
+        stale.mark_publishing()
+
+        publication.refresh_from_db()
+        self.assertEqual(publication.attempts, 2)
+        self.assertEqual(publication.status, Publication.Status.PUBLISHING)
+
+    def test_message_url_parses_target_variants(self) -> None:
+        cases = {
+            "@channel": "https://t.me/channel/5",
+            "https://t.me/channel/": "https://t.me/channel/5",
+            "HTTP://t.me/Channel": "https://t.me/Channel/5",
+            "tg://resolve?domain=channel&post=1": "https://t.me/channel/5",
+            "https://t.me/+invite": None,
+            "-100123": None,
+        }
+        for target, expected in cases.items():
+            with self.subTest(target=target):
+                publication = Publication(
+                    story=self.story,
+                    target=target,
+                    status=Publication.Status.PUBLISHED,
+                    message_ids=[5],
+                )
+                self.assertEqual(publication.message_url(), expected)
+
+    def test_mark_published_stores_integer_message_ids(self) -> None:
+        publication = Publication.objects.create(story=self.story, target="@channel")
+
+        publication.mark_published(message_ids=["5", None, 6], published_at=timezone.now())
+
+        publication.refresh_from_db()
+        self.assertEqual(publication.message_ids, [5, 6])
+        self.assertEqual(publication.primary_message_id(), 5)
+        self.assertIsNone(Publication(message_ids=["x"]).primary_message_id())
+
+    def test_story_mark_published_is_noop_when_already_published(self) -> None:
+        self.story.mark_published()
+        with self.assertNumQueries(0):
+            self.story.mark_published()
+        self.assertEqual(self.story.status, Story.Status.PUBLISHED)
+
+    def test_deliver_reuses_stored_text_without_recomposing(self) -> None:
+        publication = Publication.objects.create(
+            story=self.story,
+            target="@channel",
+            result_text="Сохранённый текст",
+        )
+        sent: list[str] = []
+
+        class StubBackend:
+            def send(self, *, story, text, target, **kwargs):
+                sent.append(text)
+                return PublishResult(message_ids=[7], published_at=timezone.now())
+
+        publisher = StoryPublisher(backend=StubBackend())
+        with patch.object(Story, "compose_publication_text") as compose:
+            publisher.deliver(publication)
+
+        compose.assert_not_called()
+        self.assertEqual(sent, ["Сохранённый текст"])
+
     def test_publish_success_updates_story_and_publication(self) -> None:
         class StubBackend:
             def __init__(self) -> None:
@@ -8,6 +8,7 @@ from unittest.mock import patch
 from django.test import SimpleTestCase, override_settings
 
 from core.constants import OPENAI_DEFAULT_TEMPERATURE
+from stories.paperbird_stories.models import RewriteResult
 from stories.paperbird_stories.services import (
     OpenAIChatProvider,
     _openai_temperature_for_model,
@@ -24,6 +25,38 @@ class RewriteHelperTests(SimpleTestCase):
         self.assertEqual(_openai_temperature_for_model("gpt-5.2"), 1.0)
         self.assertEqual(_openai_temperature_for_model("gpt-4o-mini"), OPENAI_DEFAULT_TEMPERATURE)
 
+    def test_rewrite_result_flattens_nested_content_once(self) -> None:
+        result = RewriteResult.from_dict(
+            {
+                "title": 42,
+                "content": {
+                    "paragraphs": [" Первый ", {"text": "Второй"}],
+                    "meta": [{"value": "Третий"}, "Первый"],
+                },
+            }
+        )
+
+        self.assertEqual(result.title, "42")
+        self.assertEqual(result.content, "Первый\n\nВторой\n\nТретий")
+
+    def test_rewrite_result_handles_deeply_nested_content(self) -> None:
+        node: dict = {"text": "Дно"}
+        for _ in range(5000):
+            node = {"children": [node]}
+
+        result = RewriteResult.from_dict({"content": node})
+
+        self.assertEqual(result.content, "Дно")
+
+    def test_rewrite_result_plain_string_content(self) -> None:
+        result = RewriteResult.from_dict({"title": " Заголовок ", "content": "  Текст  "})
+
+        self.assertEqual(result.title, "Заголовок")
+        self.assertEqual(result.content, "Текст")
+
+        with self.assertRaises(ValueError):
+            RewriteResult.from_dict({"content": "   "})
+
 
 class OpenAIChatProviderParsingTests(SimpleTestCase):
     class _FakeResponse:
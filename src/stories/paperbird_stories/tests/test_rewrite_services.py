@@ -6,13 +6,17 @@ from http import HTTPStatus
 from unittest.mock import MagicMock, patch
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
 
+from core import clock
+from core.constants import REWRITE_MAX_ATTEMPTS
 from projects.models import Post, Project, Source
 from stories.paperbird_stories.models import RewritePreset, RewriteTask, Story
 from stories.paperbird_stories.services import (
+    CachedRewriteProvider,
     ProviderResponse,
     RewriteFailed,
     StoryFactory,
@@ -40,6 +44,171 @@ class StoryRewriterTests(TestCase):
             editor_comment="Переделай в деловой стиль",
         )
 
+    def test_task_transitions_use_captured_clock(self) -> None:
+        task = RewriteTask.objects.create(story=self.story)
+
+        with clock.captured_now() as now:
+            task.mark_running()
+            with self.assertNumQueries(1):
+                task.mark_success(result={"ok": True}, response_id="resp-1")
+
+        self.assertEqual(task.status, RewriteTask.Status.SUCCESS)
+        self.assertEqual(task.started_at, now)
+        self.assertEqual(task.finished_at, now)
+        self.assertEqual(task.updated_at, now)
+
+        with clock.captured_now() as failed_at:
+            task.mark_failed(error="timeout")
+        task.refresh_from_db()
+        self.assertEqual(task.finished_at, failed_at)
+        self.assertEqual(task.updated_at, failed_at)
+
+    def test_preset_instruction_block_reserializes_after_save(self) -> None:
+        preset = RewritePreset.objects.create(
+            project=self.project,
+            name="Формат",
+            output_format={"title": "string"},
+        )
+        self.assertIn('"title": "string"', preset.instruction_block())
+
+        preset.output_format = {"body": "string"}
+        preset.save()
+
+        block = preset.instruction_block()
+        self.assertIn('"body": "string"', block)
+        self.assertNotIn('"title"', block)
+
+    def test_running_marks_task_failed_on_error(self) -> None:
+        task = RewriteTask.objects.create(story=self.story)
+
+        with self.assertRaises(RuntimeError), task.running():
+            raise RuntimeError("провайдер недоступен")
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, RewriteTask.Status.FAILED)
+        self.assertEqual(task.error_message, "провайдер недоступен")
+        self.assertEqual(task.attempts, 1)
+
+    def test_mark_running_claims_task_only_once(self) -> None:
+        task = RewriteTask.objects.create(story=self.story)
+        competitor = RewriteTask.objects.get(pk=task.pk)
+
+        task.mark_running()
+        with self.assertRaises(RewriteTask.AlreadyClaimed):
+            competitor.mark_running()
+
+        task.refresh_from_db()
+        self.assertEqual(task.attempts, 1)
+        self.assertEqual(competitor.status, RewriteTask.Status.PENDING)
+
+        task.mark_failed(error="timeout")
+        task.mark_running()
+        self.assertEqual(task.attempts, 2)
+
+    def test_rewrite_many_isolates_failures(self) -> None:
+        broken_post = Post.objects.create(
+            project=self.project,
+            source=self.source,
+            telegram_id=11,
+            message="Сбой провайдера",
+            posted_at=timezone.now(),
+        )
+        broken = StoryFactory(project=self.project).create(post_ids=[broken_post.id])
+
+        class StubProvider:
+            def run(self, *, messages):
+                if any("Сбой" in message["content"] for message in messages):
+                    raise RuntimeError("timeout")
+                return ProviderResponse(result={"title": "Готово", "content": "Текст"}, raw={})
+
+        tasks = StoryRewriter(provider=StubProvider()).rewrite_many(
+            [self.story, broken], concurrency=2
+        )
+
+        self.assertEqual(
+            [task.status for task in tasks],
+            [RewriteTask.Status.SUCCESS, RewriteTask.Status.FAILED],
+        )
+        tasks[1].refresh_from_db()
+        self.assertEqual(tasks[1].attempts, REWRITE_MAX_ATTEMPTS)
+        self.story.refresh_from_db()
+        broken.refresh_from_db()
+        self.assertEqual(self.story.status, Story.Status.READY)
+        self.assertEqual(broken.status, Story.Status.DRAFT)
+
+    def test_rewrite_many_skips_already_claimed_task(self) -> None:
+        other_post = Post.objects.create(
+            project=self.project,
+            source=self.source,
+            telegram_id=12,
+            message="Второй сюжет",
+            posted_at=timezone.now(),
+        )
+        other = StoryFactory(project=self.project).create(post_ids=[other_post.id])
+        original_mark_running = RewriteTask.mark_running
+
+        def mark_running(task):
+            if task.story_id == self.story.pk:
+                raise RewriteTask.AlreadyClaimed("занята")
+            original_mark_running(task)
+
+        class StubProvider:
+            def run(self, *, messages):
+                return ProviderResponse(result={"title": "Готово", "content": "Текст"}, raw={})
+
+        with patch.object(RewriteTask, "mark_running", autospec=True, side_effect=mark_running):
+            tasks = StoryRewriter(provider=StubProvider()).rewrite_many([self.story, other])
+
+        self.assertEqual(
+            [task.status for task in tasks],
+            [RewriteTask.Status.PENDING, RewriteTask.Status.SUCCESS],
+        )
+        other.refresh_from_db()
+        self.assertEqual(other.status, Story.Status.READY)
+
+    def test_cached_provider_reuses_response_for_same_prompt(self) -> None:
+        cache.clear()
+        self.addCleanup(cache.clear)
+        calls: list[list[dict[str, str]]] = []
+
+        class StubProvider:
+            model = "stub"
+
+            def run(self, *, messages):
+                calls.append(list(messages))
+                return ProviderResponse(result={"title": "T"}, raw={"n": len(calls)})
+
+        provider = CachedRewriteProvider(provider=StubProvider(), ttl=60)
+        messages = [{"role": "user", "content": "Текст"}]
+
+        first = provider.run(messages=messages)
+        second = provider.run(messages=messages)
+        provider.run(messages=[{"role": "user", "content": "Другой текст"}])
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(second.raw, first.raw)
+        self.assertEqual(second.result, {"title": "T"})
+
+    def test_cached_provider_keys_on_temperature(self) -> None:
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        class StubProvider:
+            model = "yandexgpt-lite"
+
+            def __init__(self, temperature: float) -> None:
+                self.temperature = temperature
+
+            def run(self, *, messages):
+                return ProviderResponse(result={"t": self.temperature}, raw={})
+
+        messages = [{"role": "user", "content": "Текст"}]
+        cold = CachedRewriteProvider(provider=StubProvider(0.2), ttl=60).run(messages=messages)
+        warm = CachedRewriteProvider(provider=StubProvider(0.7), ttl=60).run(messages=messages)
+
+        self.assertEqual(cold.result, {"t": 0.2})
+        self.assertEqual(warm.result, {"t": 0.7})
+
     def test_successful_rewrite_updates_story(self) -> None:
         class StubProvider:
             def __init__(self) -> None:
@@ -60,6 +60,11 @@ class StoryViewTests(TestCase):
         self.assertNotIn('<h2 class="h5">Проекты</h2>', html)
         self.assertNotIn("Создать сюжет", html)
 
+    def test_story_list_view_defers_rewrite_payloads(self) -> None:
+        response = self.client.get(reverse("stories:list"))
+        story = response.context["object_list"][0]
+        self.assertTrue({"last_rewrite_payload", "prompt_snapshot"} <= story.get_deferred_fields())
+
     def test_story_detail_has_no_back_to_list_button(self) -> None:
         response = self.client.get(reverse("stories:detail", args=[self.story.pk]))
         self.assertEqual(response.status_code, HTTPStatus.OK)
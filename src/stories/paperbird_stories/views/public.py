@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from django.db.models import Count, Q
+from django.db.models import Count, Prefetch, Q
 from django.http import Http404
 from django.views.generic import DetailView, ListView
 
@@ -12,6 +12,18 @@ from projects.models import Project
 from stories.paperbird_stories.models import Publication, StoryImage
 
 
+def _preview_image(images: list[StoryImage]) -> StoryImage | None:
+    """Первое выбранное изображение сюжета, иначе первое из имеющихся.
+
+    Работает по уже подгруженному (`prefetch_related("story__images")`) списку.
+    """
+
+    for image in images:
+        if image.is_selected:
+            return image
+    return images[0] if images else None
+
+
 class PublicIndexView(ListView):
     """Public directory of projects with published content."""
 
@@ -59,9 +71,33 @@ class PublicProjectView(ListView):
             raise Http404("Проект не найден") from exc
 
     def get_queryset(self):
+        # Карточке нужны только заголовок, текст, дата и превью — остальные
+        # колонки (в том числе JSON-ответы Telegram и модели) не загружаем.
         return (
-            Publication.objects.select_related("story", "story__project")
-            .prefetch_related("story__images")
+            Publication.objects.with_related()
+            .only(
+                "id",
+                "published_at",
+                "result_text",
+                "story",
+                "story__title",
+                "story__body",
+                "story__project",
+                "story__project__name",
+            )
+            .prefetch_related(
+                Prefetch(
+                    "story__images",
+                    queryset=StoryImage.objects.only(
+                        "id",
+                        "story_id",
+                        "image_file",
+                        "is_selected",
+                        "is_main",
+                        "created_at",
+                    ),
+                )
+            )
             .filter(
                 story__project_id=self.project.pk,
                 status=Publication.Status.PUBLISHED,
@@ -118,8 +154,7 @@ class PublicProjectView(ListView):
 
     @staticmethod
     def _preview_image(publication: Publication) -> StoryImage | None:
-        story = publication.story
-        return story.images.filter(is_selected=True).first() or story.images.first()
+        return _preview_image(list(publication.story.images.all()))
 
 
 class PublicPublicationView(DetailView):
@@ -133,7 +168,12 @@ class PublicPublicationView(DetailView):
     def get_queryset(self):
         project_id = self.kwargs.get("project_id")
         return (
-            Publication.objects.select_related("story", "story__project")
+            Publication.objects.with_related()
+            .defer(
+                "raw_response",
+                "story__last_rewrite_payload",
+                "story__prompt_snapshot",
+            )
             .prefetch_related("story__images")
             .filter(
                 story__project_id=project_id,
@@ -149,12 +189,13 @@ class PublicPublicationView(DetailView):
         context["project"] = story.project
         context["title"] = story.title or f"Сюжет #{story.pk}"
         context["text"] = self._publication_text(publication)
-        context["images"] = story.images.filter(is_selected=True)
+        images = list(story.images.all())
+        context["images"] = [image for image in images if image.is_selected]
         context["public_noindex"] = story.project.public_noindex
         context["public_title"] = story.project.public_title or story.project.name
         context["message_url"] = publication.message_url()
         context["og_description"] = PublicProjectView._excerpt(context["text"], limit=160)
-        context["og_image"] = self._preview_image(story)
+        context["og_image"] = _preview_image(images)
         if context["og_image"]:
             context["og_image_url"] = self.request.build_absolute_uri(
                 context["og_image"].image_file.url
@@ -167,7 +208,3 @@ class PublicPublicationView(DetailView):
         if text:
             return text
         return (publication.story.body or "").strip()
-
-    @staticmethod
-    def _preview_image(story) -> StoryImage | None:
-        return story.images.filter(is_selected=True).first() or story.images.first()
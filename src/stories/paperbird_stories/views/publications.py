@@ -7,6 +7,7 @@ from typing import Any
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import IntegrityError
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect
 from django.views.generic import ListView
@@ -28,7 +29,12 @@ class PublicationListView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         return (
             Publication.objects.filter(story__project__owner=self.request.user)
-            .select_related("story", "story__project")
+            .with_related()
+            .defer(
+                "raw_response",
+                "story__last_rewrite_payload",
+                "story__prompt_snapshot",
+            )
             .order_by("-created_at")
         )
 
@@ -59,9 +65,10 @@ class PublicationListView(LoginRequiredMixin, ListView):
         return context
 
     def post(self, request, *args, **kwargs):
-        publication = self._get_publication(request.POST.get("publication_id"))
-        page = request.POST.get("page") or ""
-        submit_action = request.POST.get("submit_action", "save")
+        post = request.POST
+        publication = self._get_publication(post.get("publication_id"))
+        page = post.get("page") or ""
+        submit_action = post.get("submit_action", "save")
         if submit_action == "delete":
             title = publication.story.title or f"Сюжет #{publication.story_id}"
             publication.delete()
@@ -74,7 +81,12 @@ class PublicationListView(LoginRequiredMixin, ListView):
             prefix=self._form_prefix(publication),
         )
         if form.is_valid():
-            updated = form.save()
+            try:
+                updated = form.save()
+            except IntegrityError:
+                # Форма проверяет то же условие; сюда попадаем только при гонке.
+                messages.error(request, "Не удалось сохранить публикацию: проверьте даты.")
+                return self._redirect_to_page(page)
             display_title = updated.story.title or f"Сюжет #{updated.story_id}"
             messages.success(
                 request,
@@ -118,7 +130,7 @@ class PublicationListView(LoginRequiredMixin, ListView):
         if not identifier or not str(identifier).isdigit():
             raise Http404("Публикация не найдена")
         return get_object_or_404(
-            Publication.objects.select_related("story", "story__project"),
+            Publication.objects.with_related(),
             pk=int(identifier),
             story__project__owner=self.request.user,
         )
@@ -25,6 +25,7 @@ from django.views.generic import DetailView
 from core.constants import REWRITE_MODEL_CHOICES, normalize_openai_model
 from projects.services.telethon_client import TelethonCredentialsMissingError
 from stories.paperbird_stories.forms import (
+    ACTIVE_PRESETS_PREFETCH,
     StoryContentForm,
     StoryPromptConfirmForm,
     StoryPublishForm,
@@ -55,11 +56,11 @@ class StoryDetailView(LoginRequiredMixin, DetailView):
         return (
             Story.objects.filter(project__owner=self.request.user)
             .select_related("project")
+            .with_ordered_posts()
             .prefetch_related(
-                "story_posts__post",
-                "story_posts__post__source",
                 "rewrite_tasks",
                 "publications",
+                ACTIVE_PRESETS_PREFETCH,
             )
         )
 
@@ -85,7 +86,7 @@ class StoryDetailView(LoginRequiredMixin, DetailView):
         )
         context["publications"] = self.object.publications.order_by("-created_at")
         context["last_task"] = self.object.rewrite_tasks.first()
-        story_posts = list(self.object.story_posts.select_related("post", "post__source"))
+        story_posts = list(self.object.ordered_story_posts())
         for story_post in story_posts:
             story_post.can_attach = self._can_attach_media(story_post.post)
         context["story_posts"] = story_posts
@@ -352,7 +353,7 @@ class StoryDetailView(LoginRequiredMixin, DetailView):
             return redirect(self._build_success_url(step="rewrite"))
 
         post = get_object_or_404(
-            self.object.ordered_posts().select_related("source"),
+            self.object.posts.select_related("source"),
             pk=int(post_id),
         )
         media_info = self._find_post_media(post, allow_download=True)
@@ -109,10 +109,10 @@ class StoryImageView(LoginRequiredMixin, DetailView):
         prompt = Path(image_file.name).stem
         mime_type = image_file.content_type
 
-        try:
-            image_data = image_file.read()
-        except Exception as exc:
-            if is_ajax:
+        if is_ajax:
+            try:
+                image_data = image_file.read()
+            except Exception as exc:
                 return JsonResponse(
                     {
                         "status": "error",
@@ -120,10 +120,6 @@ class StoryImageView(LoginRequiredMixin, DetailView):
                     },
                     status=500,
                 )
-            messages.error(request, f"Не удалось прочитать файл: {exc}")
-            return self.render_to_response(self.get_context_data(upload_form=form))
-
-        if is_ajax:
             encoded = base64.b64encode(image_data).decode("ascii")
             preview_data = {
                 "data": encoded,
@@ -134,15 +130,16 @@ class StoryImageView(LoginRequiredMixin, DetailView):
             preview_data["preview_token"] = preview_token
             return JsonResponse({"status": "success", "preview": preview_data})
 
-        # Fallback for non-AJAX
+        # Fallback for non-AJAX: загруженный файл передаётся в хранилище как есть
+        # и пишется по частям, без чтения целиком в память.
         try:
             self.object.attach_image(
                 prompt=prompt,
-                data=image_data,
+                data=image_file,
                 mime_type=mime_type,
                 source_kind=StoryImage.SourceKind.UPLOAD,
             )
-        except ValueError as exc:
+        except (ValueError, OSError) as exc:
             messages.error(request, f"Не удалось прикрепить изображение: {exc}")
         else:
             messages.success(request, "Изображение загружено и прикреплено к сюжету.")
@@ -280,34 +277,38 @@ class StoryImageView(LoginRequiredMixin, DetailView):
                 self._clear_preview(request)
                 messages.success(request, "Изображение прикреплено к сюжету.")
                 return redirect("stories:detail", pk=self.object.pk)
+            finally:
+                if not isinstance(data, bytes):
+                    data.close()
 
-        encoded = request.POST.get("image_data", "")
+        post = request.POST
+        encoded = post.get("image_data", "")
         preview = None
         if encoded:
-            safe_size = normalize_image_size(request.POST.get("size", ""))
-            safe_quality = normalize_image_quality(request.POST.get("quality", ""))
+            safe_size = normalize_image_size(post.get("size", ""))
+            safe_quality = normalize_image_quality(post.get("quality", ""))
             preview = {
                 "data": encoded,
-                "mime": request.POST.get("mime_type", "image/png"),
-                "prompt": request.POST.get("prompt", ""),
-                "model": request.POST.get("model", ""),
+                "mime": post.get("mime_type", "image/png"),
+                "prompt": post.get("prompt", ""),
+                "model": post.get("model", ""),
                 "size": safe_size,
                 "quality": safe_quality,
-                "aspect_ratio": request.POST.get("aspect_ratio", ""),
-                "image_size": request.POST.get("image_size", ""),
+                "aspect_ratio": post.get("aspect_ratio", ""),
+                "image_size": post.get("image_size", ""),
             }
         else:
-            token = (request.POST.get("preview_token") or "").strip()
+            token = (post.get("preview_token") or "").strip()
             if token:
                 stored = self._load_preview(request, token)
                 if stored:
                     preview = {
                         "data": base64.b64encode(stored["data"]).decode("ascii"),
                         "mime": stored["mime"],
-                        "prompt": request.POST.get("prompt", ""),
-                        "model": request.POST.get("model", ""),
-                        "size": normalize_image_size(request.POST.get("size", "")),
-                        "quality": normalize_image_quality(request.POST.get("quality", "")),
+                        "prompt": post.get("prompt", ""),
+                        "model": post.get("model", ""),
+                        "size": normalize_image_size(post.get("size", "")),
+                        "quality": normalize_image_quality(post.get("quality", "")),
                         "preview_token": token,
                     }
         context = self.get_context_data(
@@ -381,7 +382,7 @@ class StoryImageView(LoginRequiredMixin, DetailView):
             return redirect("stories:image", pk=self.object.pk)
 
         post = get_object_or_404(
-            self.object.ordered_posts().select_related("source"),
+            self.object.posts.select_related("source"),
             pk=int(post_id),
         )
         media = self._find_post_media(post, allow_download=True)
@@ -448,7 +449,7 @@ class StoryImageView(LoginRequiredMixin, DetailView):
         media: list[dict[str, Any]] = []
         seen_paths: set[str] = set()
         seen_hashes: set[str] = set()
-        posts = self.object.ordered_posts().select_related("source")
+        posts = self.object.ordered_posts()
         for post in posts:
             candidate = self._find_post_media(post)
             if not candidate:
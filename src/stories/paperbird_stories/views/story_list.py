@@ -21,7 +21,11 @@ class StoryListView(LoginRequiredMixin, ListView):
     context_object_name = "stories"
 
     def get_queryset(self):
-        return Story.objects.filter(project__owner=self.request.user).select_related("project")
+        return (
+            Story.objects.for_listing()
+            .filter(project__owner=self.request.user)
+            .select_related("project")
+        )
 
 
 class StoryCreateView(LoginRequiredMixin, View):
@@ -43,26 +47,22 @@ class StoryCreateView(LoginRequiredMixin, View):
             Project.objects.filter(owner=request.user),
             pk=project_id,
         )
-        posts = list(
-            Post.objects.filter(project=project, pk__in=selected_ids)
-            .select_related("project")
+        selected_ids = list(dict.fromkeys(selected_ids))
+        found_ids = set(
+            Post.objects.filter(project=project, pk__in=selected_ids).values_list("pk", flat=True)
         )
-        if len(posts) == 0:
+        if not found_ids:
             messages.error(request, "Не удалось найти выбранные посты")
             return self._redirect_back(project.pk)
-        found_ids = {post.pk for post in posts}
-        missing_ids = {pk for pk in selected_ids if pk not in found_ids}
-        if missing_ids:
+        if len(found_ids) != len(selected_ids):
             messages.error(
                 request,
                 "Некоторые выбранные посты больше недоступны. Обновите ленту и выберите заново.",
             )
             return self._redirect_back(project.pk)
-        order_map = {pk: index for index, pk in enumerate(selected_ids)}
-        posts.sort(key=lambda post: order_map.get(post.pk, 0))
         try:
             story = StoryFactory(project=project).create(
-                post_ids=[post.pk for post in posts],
+                post_ids=selected_ids,
                 title="",
             )
         except StoryCreationError as exc:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from core.logging import event_logger, logging_context
@@ -85,14 +86,8 @@ def publish_story_task(task: WorkerTask) -> dict[str, Any]:
         return {"status": publication.status}
 
 
-_is_registered = False
-
-
+@functools.cache
 def register_publish_worker() -> None:
     """Ensure the publish queue has a handler registered."""
 
-    global _is_registered
-    if _is_registered:
-        return
     register_handler(WorkerTask.Queue.PUBLISH, publish_story_task)
-    _is_registered = True